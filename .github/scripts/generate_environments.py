@@ -16,38 +16,34 @@ Generated files:
     - containers/pipeline/environment_pipeline.yml (updated with core deps)
 """
 
+import functools
 import re
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11; testing.yml provides tomli
+    import tomli as tomllib
 
-def parse_pyproject():
-    """Parse pyproject.toml and extract dependencies using regex."""
-    toml_path = Path(__file__).parent.parent.parent / "pyproject.toml"
-    content = toml_path.read_text()
-
-    # Extract Python requirement
-    py_match = re.search(r'requires-python\s*=\s*"([^"]+)"', content)
-    py_req = py_match.group(1) if py_match else ">=3.10"
+# Leading package name of a PEP 508 requirement, up to the first specifier
+_NAME_RE = re.compile(r"\s*([A-Za-z0-9_.\-]+)")
 
-    # Extract dependencies list
-    deps_match = re.search(r"dependencies\s*=\s*\[([\s\S]*?)\]", content, re.MULTILINE)
+# Conda packages kept in the minimal environment; everything else goes to pip
+_ESSENTIAL_RE = re.compile(r"python|snakemake|numpy|pandas", re.IGNORECASE)
 
-    core_deps = []
-    if deps_match:
-        deps_text = deps_match.group(1)
-        # Extract quoted strings (dependency specifications)
-        dep_lines = re.findall(r'"([^"]+)"', deps_text)
-        core_deps = [d.strip() for d in dep_lines if d.strip()]
 
-    # Extract optional dependencies (slurm)
-    slurm_match = re.search(r"slurm\s*=\s*\[([\s\S]*?)\]", content, re.MULTILINE)
+def parse_pyproject():
+    """Parse pyproject.toml and extract dependencies."""
+    toml_path = Path(__file__).parent.parent.parent / "pyproject.toml"
+    with open(toml_path, "rb") as f:
+        project = tomllib.load(f).get("project", {})
 
-    slurm_deps = []
-    if slurm_match:
-        slurm_text = slurm_match.group(1)
-        slurm_deps = re.findall(r'"([^"]+)"', slurm_text)
+    py_req = project.get("requires-python", ">=3.10")
+    core_deps = [d.strip() for d in project.get("dependencies", []) if d.strip()]
+    slurm_deps = project.get("optional-dependencies", {}).get("slurm", [])
 
     return core_deps, slurm_deps, py_req
 
@@ -59,20 +55,9 @@ def normalize_dep(dep_str: str) -> Tuple[str, str]:
     Returns:
         (package_name, conda_spec)
     """
-    # Find the position of the first operator
-    operators = ["<=", ">=", "==", "!=", "<", ">"]
-    min_pos = len(dep_str)
-    
-    for op in operators:
-        pos = dep_str.find(op)
-        if pos != -1 and pos < min_pos:
-            min_pos = pos
-    
-    if min_pos < len(dep_str):
-        name = dep_str[:min_pos].strip()
-        return name, dep_str.strip()
-    
-    return dep_str.strip(), dep_str.strip()
+    spec = dep_str.strip()
+    match = _NAME_RE.match(dep_str)
+    return (match.group(1) if match else spec), spec
 
 
 def separate_conda_and_pip(deps: List[str]) -> Tuple[List[str], List[str]]:
@@ -96,10 +81,35 @@ def separate_conda_and_pip(deps: List[str]) -> Tuple[List[str], List[str]]:
     return conda_deps, pip_deps
 
 
-def generate_environment_yml(core_deps: List[str], py_req: str, output_path: Path):
-    """Generate environment.yml with full pipeline dependencies."""
+@dataclass(frozen=True, slots=True)
+class PyProjectInfo:
+    """Dependency information derived from pyproject.toml."""
+
+    py_req: str
+    core_deps: Tuple[str, ...]
+    slurm_deps: Tuple[str, ...]
+    conda_deps: Tuple[str, ...]
+    pip_deps: Tuple[str, ...]
 
+
+@functools.lru_cache(maxsize=1)
+def load_pyproject_info() -> PyProjectInfo:
+    """Parse pyproject.toml and split its dependencies, once per process."""
+    core_deps, slurm_deps, py_req = parse_pyproject()
     conda_deps, pip_deps = separate_conda_and_pip(core_deps)
+    return PyProjectInfo(
+        py_req=py_req,
+        core_deps=tuple(core_deps),
+        slurm_deps=tuple(slurm_deps),
+        conda_deps=tuple(conda_deps),
+        pip_deps=tuple(pip_deps),
+    )
+
+
+def generate_environment_yml(
+    conda_deps: Sequence[str], pip_deps: Sequence[str], py_req: str, output_path: Path
+):
+    """Generate environment.yml with full pipeline dependencies."""
 
     env_data = {
         "name": "seqnado",
@@ -108,7 +118,7 @@ def generate_environment_yml(core_deps: List[str], py_req: str, output_path: Pat
             "# Core Python dependencies (synced from pyproject.toml)",
             f"python{py_req}",
         ]
-        + conda_deps
+        + list(conda_deps)
         + [
             "",
             "# Bioinformatics tools",
@@ -137,25 +147,19 @@ def generate_environment_yml(core_deps: List[str], py_req: str, output_path: Pat
     }
 
     if pip_deps:
-        env_data["dependencies"].append({"pip": pip_deps})
+        env_data["dependencies"].append({"pip": list(pip_deps)})
 
     _write_yaml(output_path, env_data)
     print(f"✓ Generated {output_path}")
 
 
 def generate_environment_minimal_yml(
-    core_deps: List[str], py_req: str, output_path: Path
+    conda_deps: Sequence[str], pip_deps: Sequence[str], py_req: str, output_path: Path
 ):
     """Generate environment_minimal.yml for development."""
 
-    conda_deps, pip_deps = separate_conda_and_pip(core_deps)
-
     # For minimal, only include essential conda packages
-    essential_conda = [
-        d
-        for d in conda_deps
-        if any(x in d.lower() for x in ["python", "snakemake", "numpy", "pandas"])
-    ]
+    essential_conda = [d for d in conda_deps if _ESSENTIAL_RE.search(d)]
 
     env_data = {
         "name": "seqnado",
@@ -170,19 +174,20 @@ def generate_environment_minimal_yml(
         ],
     }
 
-    if pip_deps or [d for d in conda_deps if d not in essential_conda]:
-        all_pip = pip_deps + [d for d in conda_deps if d not in essential_conda]
-        env_data["dependencies"].append({"pip": all_pip})
+    essential_set = set(essential_conda)
+    extra_deps = [d for d in conda_deps if d not in essential_set]
+    if pip_deps or extra_deps:
+        env_data["dependencies"].append({"pip": [*pip_deps, *extra_deps]})
 
     _write_yaml(output_path, env_data)
     print(f"✓ Generated {output_path}")
 
 
-def generate_testing_yml(core_deps: List[str], py_req: str, output_path: Path):
+def generate_testing_yml(
+    conda_deps: Sequence[str], pip_deps: Sequence[str], py_req: str, output_path: Path
+):
     """Generate testing.yml for CI/testing."""
 
-    conda_deps, pip_deps = separate_conda_and_pip(core_deps)
-
     env_data = {
         "name": "test",
         "channels": ["conda-forge", "bioconda", "defaults"],
@@ -190,32 +195,32 @@ def generate_testing_yml(core_deps: List[str], py_req: str, output_path: Path):
             "# Testing environment (synced from pyproject.toml)",
             f"python{py_req}",
         ]
-        + conda_deps
+        + list(conda_deps)
         + [
             "pip",
             "pytest",
             "pytest-cov",
             "pytest-xdist",
+            # tomllib backport: the tests import this script on Python 3.10
+            "tomli",
         ],
     }
 
     if pip_deps:
-        env_data["dependencies"].append({"pip": pip_deps})
+        env_data["dependencies"].append({"pip": list(pip_deps)})
 
     _write_yaml(output_path, env_data)
     print(f"✓ Generated {output_path}")
 
 
 def update_pipeline_environment_yml(
-    core_deps: List[str], py_req: str, output_path: Path
+    conda_deps: Sequence[str], pip_deps: Sequence[str], py_req: str, output_path: Path
 ):
     """
     Update containers/pipeline/environment_pipeline.yml with core deps.
     Preserves existing bioinformatics and R/Bioconductor packages.
     """
 
-    conda_deps, pip_deps = separate_conda_and_pip(core_deps)
-
     # Restrict Python range for containers
     py_spec = f"python{py_req},<3.13"
 
@@ -226,7 +231,7 @@ def update_pipeline_environment_yml(
             "# Python and core dependencies (synced from pyproject.toml)",
             py_spec,
         ]
-        + conda_deps
+        + list(conda_deps)
         + [
             "pip",
             "",
@@ -303,66 +308,77 @@ def update_pipeline_environment_yml(
     }
 
     if pip_deps:
-        env_data["dependencies"].append({"pip": pip_deps})
+        env_data["dependencies"].append({"pip": list(pip_deps)})
 
     _write_yaml(output_path, env_data)
     print(f"✓ Generated {output_path}")
 
 
+def _dependency_kind(dep) -> str:
+    """Classify an env_data dependency entry for rendering."""
+    if isinstance(dep, dict):
+        return "pip"
+    if dep.startswith("#"):
+        return "comment"
+    return "pkg" if dep else "blank"
+
+
+_DEPENDENCY_FORMATTERS = {
+    "comment": lambda dep: f"  {dep}\n",
+    "blank": lambda dep: "\n",
+    "pkg": lambda dep: f"  - {dep}\n",
+    "pip": lambda dep: "  - pip:\n"
+    + "".join(f"      - {pip_pkg}\n" for pip_pkg in dep["pip"]),
+}
+
+
 def _write_yaml(path: Path, data: dict):
     """Write YAML file with custom formatting for conda compatibility."""
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(path, "w") as f:
-        # Custom YAML dump for better formatting
-        f.write("# Environment file auto-generated from pyproject.toml\n")
-        f.write(
-            "# Do not edit manually - run: python .github/scripts/generate_environments.py\n\n"
+    # Custom YAML dump for better formatting
+    parts = [
+        "# Environment file auto-generated from pyproject.toml\n",
+        "# Do not edit manually - run: python .github/scripts/generate_environments.py\n\n",
+    ]
+
+    if "name" in data:
+        parts.append(f"name: {data['name']}\n")
+
+    if "channels" in data:
+        parts.append("channels:\n")
+        for channel in data["channels"]:
+            parts.append(f"  - {channel}\n")
+
+    if "dependencies" in data:
+        parts.append("dependencies:\n")
+        parts.extend(
+            _DEPENDENCY_FORMATTERS[_dependency_kind(dep)](dep)
+            for dep in data["dependencies"]
         )
 
-        if "name" in data:
-            f.write(f"name: {data['name']}\n")
-
-        if "channels" in data:
-            f.write(f"channels:\n")
-            for channel in data["channels"]:
-                f.write(f"  - {channel}\n")
-
-        if "dependencies" in data:
-            f.write(f"dependencies:\n")
-            for dep in data["dependencies"]:
-                if isinstance(dep, str):
-                    if dep.startswith("#"):
-                        f.write(f"  {dep}\n")
-                    elif dep == "":
-                        f.write(f"\n")
-                    else:
-                        f.write(f"  - {dep}\n")
-                elif isinstance(dep, dict) and "pip" in dep:
-                    f.write(f"  - pip:\n")
-                    for pip_pkg in dep["pip"]:
-                        f.write(f"      - {pip_pkg}\n")
+    with open(path, "w") as f:
+        f.write("".join(parts))
 
 
 def main():
     """Generate all environment files."""
 
     print("Parsing pyproject.toml...")
-    core_deps, slurm_deps, py_req = parse_pyproject()
+    info = load_pyproject_info()
 
-    print(f"Found {len(core_deps)} core dependencies")
-    print(f"Python requirement: {py_req}")
+    print(f"Found {len(info.core_deps)} core dependencies")
+    print(f"Python requirement: {info.py_req}")
 
     repo_root = Path(__file__).parent.parent.parent
+    deps = (info.conda_deps, info.pip_deps, info.py_req)
 
     print("\nGenerating environment files...")
-    generate_environment_yml(core_deps, py_req, repo_root / "environment.yml")
-    generate_environment_minimal_yml(
-        core_deps, py_req, repo_root / "environment_minimal.yml"
-    )
-    generate_testing_yml(core_deps, py_req, repo_root / "testing.yml")
+    generate_environment_yml(*deps, repo_root / "environment.yml")
+    generate_environment_minimal_yml(*deps, repo_root / "environment_minimal.yml")
+    generate_testing_yml(*deps, repo_root / "testing.yml")
     update_pipeline_environment_yml(
-        core_deps, py_req, repo_root / "containers/pipeline/environment_pipeline.yml"
+        *deps, repo_root / "containers/pipeline/environment_pipeline.yml"
     )
 
     print("\n✓ All environment files generated successfully!")
@@ -14,20 +14,37 @@ import yaml
 import re
 from pathlib import Path
 
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
+_JINJA_SET_RE = re.compile(r'{%\s*set\s+(\w+)\s*=\s*"([^"]*?)"\s*%}')
+_JINJA_EXPR_RE = re.compile(r'{{.*?}}', re.DOTALL)
+_VERSION_RE = re.compile(r'version\s*=\s*"[^"]*"')
+_PLACEHOLDER_RE = re.compile(r'__JINJA_\d+__')
+
 
 def extract_jinja2_and_yaml(raw_content):
     """
     Separate Jinja2 statements from YAML content.
     
+    Args:
+        raw_content: meta.yaml content, either as a string or as an
+            iterable of lines (e.g. an open file handle)
+    
     Returns:
         tuple: (jinja_lines, yaml_content)
     """
     jinja_lines = []
     yaml_lines = []
-    jinja_pattern = r'{%\s*set\s+(\w+)\s*=\s*"([^"]*?)"\s*%}'
     
-    for line in raw_content.split('\n'):
-        if re.match(jinja_pattern, line.strip()):
+    if isinstance(raw_content, str):
+        raw_content = raw_content.split('\n')
+    
+    for line in raw_content:
+        line = line.rstrip('\n')
+        if _JINJA_SET_RE.match(line.strip()):
             jinja_lines.append(line)
         else:
             yaml_lines.append(line)
@@ -51,16 +68,15 @@ def replace_jinja_expressions(yaml_content):
         placeholder_counter[0] += 1
         return placeholder
     
-    modified = re.sub(r'{{.*?}}', replace_expr, yaml_content, flags=re.DOTALL)
+    modified = _JINJA_EXPR_RE.sub(replace_expr, yaml_content)
     return modified, jinja_placeholders
 
 
 def restore_jinja_expressions(text, jinja_placeholders):
     """Restore Jinja2 expressions from placeholders."""
-    result = text
-    for placeholder, original in jinja_placeholders.items():
-        result = result.replace(placeholder, original)
-    return result
+    return _PLACEHOLDER_RE.sub(
+        lambda m: jinja_placeholders.get(m.group(0), m.group(0)), text
+    )
 
 
 def update_meta_yaml(version, sha256, meta_deps_path):
@@ -99,45 +115,43 @@ def update_meta_yaml(version, sha256, meta_deps_path):
     
     # Load meta.yaml and handle Jinja2
     with open(meta_file) as f:
-        raw_content = f.read()
+        jinja_lines, yaml_content = extract_jinja2_and_yaml(f)
     
-    jinja_lines, yaml_content = extract_jinja2_and_yaml(raw_content)
     yaml_content, jinja_placeholders = replace_jinja_expressions(yaml_content)
     
     # Parse YAML safely
-    meta = yaml.safe_load(yaml_content)
+    meta = yaml.load(yaml_content, Loader=SafeLoader)
     
     # Update content
     meta["package"]["version"] = version
     meta["source"]["sha256"] = sha256
     meta["requirements"]["run"] = run_deps
     
+    # Write Jinja2 statements
+    output_lines = [
+        _VERSION_RE.sub(f'version = "{version}"', line) + '\n'
+        for line in jinja_lines
+    ]
+    
+    if jinja_lines:
+        output_lines.append('\n')
+    
+    # Dump YAML and restore Jinja2 expressions
+    yaml_str = yaml.dump(
+        meta, Dumper=SafeDumper, default_flow_style=False, sort_keys=False
+    )
+    yaml_str = restore_jinja_expressions(yaml_str, jinja_placeholders)
+    output_lines.extend(yaml_str.splitlines(keepends=True))
+    
     # Write back with Jinja2 preserved
     with open(meta_file, "w") as f:
-        # Write Jinja2 statements
-        for line in jinja_lines:
-            line = re.sub(r'version\s*=\s*"[^"]*"', f'version = "{version}"', line)
-            f.write(line + '\n')
-        
-        if jinja_lines:
-            f.write('\n')
-        
-        # Dump YAML and restore Jinja2 expressions
-        yaml_str = yaml.dump(meta, default_flow_style=False, sort_keys=False)
-        yaml_str = restore_jinja_expressions(yaml_str, jinja_placeholders)
-        f.write(yaml_str)
+        f.writelines(output_lines)
     
     print(f"✓ Updated version to {version}")
     print(f"✓ Updated SHA256")
     print(f"✓ Updated {len(run_deps)} run dependencies")
     print(f"\n=== Updated meta.yaml (first 50 lines) ===")
-    
-    with open(meta_file) as f:
-        for i, line in enumerate(f, 1):
-            if i <= 50:
-                print(line, end="")
-            else:
-                break
+    print("".join(output_lines[:50]), end="")
 
 
 if __name__ == "__main__":
@@ -11,11 +11,21 @@ Usage:
 """
 
 import argparse
+import functools
 import json
+import os
 import re
 import sys
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib parser
+    orjson = None
 
 from seqnado.tools import (
     format_citation,
@@ -27,13 +37,21 @@ from seqnado.tools import (
     is_apptainer_available,
 )
 
-TOOL_TEMPLATE = """#### {display_name}
-**Purpose**: {description}  
-**Version**: {version}  
-**Usage**: {usage}  
-**Reference**: {citation}
+_DOI_RE = re.compile(r'doi:\s*([^\s,]+)')
+_URL_FIELD_RE = re.compile(r',?\s*URL:\s*https?://[^\s,]+')
+_URL_RE = re.compile(r'URL:\s*(https?://[^\s,]+)')
+_DOT_COMMA_RE = re.compile(r'\.,')
+_COMMA_DOT_RE = re.compile(r',\.')
+# A citation containing none of these substrings is returned unchanged
+_CITATION_TOKENS = ("URL:", "doi:", ".,", ",.")
 
-"""
+# Everything from this heading to the end of the document is regenerated
+TOOLS_SECTION_MARKER = "\n## Tools\n"
+
+# Version lookups mostly wait on subprocesses, so threads overlap well
+MAX_WORKERS = 16
+# Large enough that citation.md goes out in a single write
+WRITE_BUFFER_SIZE = 1 << 20
 
 
 def _convert_citation_to_markdown_links(citation_text: str) -> str:
@@ -47,51 +65,61 @@ def _convert_citation_to_markdown_links(citation_text: str) -> str:
     To markdown link with DOI only:
         [doi:10.1234/example](https://doi.org/10.1234/example)
     """
+    # Nothing to link or clean up: skip the regex work entirely
+    if not any(token in citation_text for token in _CITATION_TOKENS):
+        return citation_text
+
     # Check if there's a DOI in the citation
-    doi_match = re.search(r'doi:\s*([^\s,]+)', citation_text)
-    
+    doi_match = _DOI_RE.search(citation_text) if "doi:" in citation_text else None
+
     if doi_match:
         # If DOI exists, use it and remove the URL part
         doi = doi_match.group(1)
         # Remove trailing punctuation
         doi = doi.rstrip('.,')
         # Remove the URL field entirely (with or without preceding comma)
-        citation_text = re.sub(
-            r',?\s*URL:\s*https?://[^\s,]+',
-            '',
-            citation_text
-        )
+        if "URL:" in citation_text:
+            citation_text = _URL_FIELD_RE.sub('', citation_text)
         # Convert DOI to markdown link - allow periods in DOI (don't exclude with \.)
-        citation_text = re.sub(
-            r'doi:\s*[^\s,]+',
+        citation_text = _DOI_RE.sub(
             f'[https://doi.org/{doi}](https://doi.org/{doi})',
             citation_text
         )
-    else:
+    elif "URL:" in citation_text:
         # If no DOI, use the URL
-        citation_text = re.sub(
-            r'URL:\s*(https?://[^\s,]+)',
-            r'[\1](\1)',
-            citation_text
-        )
-    
-    # Clean up double punctuation patterns (e.g., "2011.," -> "2011.")
-    citation_text = re.sub(r'\.,', '.', citation_text)
-    citation_text = re.sub(r',\.', '.', citation_text)
-    
+        citation_text = _URL_RE.sub(r'[\1](\1)', citation_text)
+
+    # Clean up double punctuation patterns (e.g., "2011.," -> "2011.").
+    # These run as separate passes after the substitutions above, in this
+    # order, so e.g. ",.," still collapses to "."
+    if ".," in citation_text:
+        citation_text = _DOT_COMMA_RE.sub('.', citation_text)
+    if ",." in citation_text:
+        citation_text = _COMMA_DOT_RE.sub('.', citation_text)
+
     return citation_text
 
 
+@functools.lru_cache(maxsize=1)
+def _apptainer_available() -> bool:
+    """Probe for apptainer/singularity once per run."""
+    return is_apptainer_available()
+
+
+@functools.lru_cache(maxsize=None)
 def _get_tool_version_for_docs(tool_name: str) -> str:
     """Get tool version for documentation.
 
+    Results are cached, so the tools.json update and the citation.md
+    generation share a single lookup per tool.
+
     Priority order:
     1. Live detection via containers (when apptainer is available)
     2. Live detection via local tool execution
     3. Static version from tools.json
     4. Fallback string
     """
-    if is_apptainer_available():
+    if _apptainer_available():
         version = get_tool_version(tool_name, use_container=True)
         if version and version != "Version information not available":
             return version
@@ -109,7 +137,22 @@ def _get_tool_version_for_docs(tool_name: str) -> str:
     return "Latest via container"
 
 
-def generate_tool_entry(tool_name: str, tool_info: Dict) -> str:
+def _prefetch_versions(tool_names: Iterable[str]) -> Dict[str, str]:
+    """Look up versions for many tools concurrently.
+
+    Version detection waits on container/tool subprocesses, so running the
+    lookups in a thread pool overlaps that latency.
+    """
+    tool_names = list(tool_names)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return dict(
+            zip(tool_names, executor.map(_get_tool_version_for_docs, tool_names))
+        )
+
+
+def generate_tool_entry(
+    tool_name: str, tool_info: Dict, version: Optional[str] = None
+) -> str:
     """Generate a markdown entry for a single tool"""
     # Get display name from tool info, fallback to formatted tool name
     display_name = tool_info.get(
@@ -122,8 +165,9 @@ def generate_tool_entry(tool_name: str, tool_info: Dict) -> str:
     # Get usage description from tool info, fallback to description
     usage = tool_info.get("usage", description)
 
-    # Get version via live detection (container or local)
-    version = _get_tool_version_for_docs(tool_name)
+    # Get version via live detection (container or local) unless prefetched
+    if version is None:
+        version = _get_tool_version_for_docs(tool_name)
 
     # Get citation
     citation_text = "See documentation"
@@ -143,52 +187,96 @@ def generate_tool_entry(tool_name: str, tool_info: Dict) -> str:
             )
             pass
 
-    return TOOL_TEMPLATE.format(
-        display_name=display_name,
-        description=description,
-        version=version,
-        usage=usage,
-        citation=citation_text,
+    return "".join(
+        [
+            "#### ", display_name,
+            "\n**Purpose**: ", description,
+            "  \n**Version**: ", version,
+            "  \n**Usage**: ", usage,
+            "  \n**Reference**: ", citation_text,
+            "\n\n",
+        ]
     )
 
 
-def generate_tools_section() -> str:
-    """Generate the complete Tools section organized by category"""
+def iter_tools_section() -> Iterator[str]:
+    """Yield the Tools section, organized by category, one chunk at a time.
+
+    Joining the chunks gives the same text as generate_tools_section().
+    """
     tools = get_available_tools()
     categories = get_categories()
 
-    lines = [
-        "## Tools",
-        "",
-        "Tools are organized by category, matching the structure of the `seqnado tools` CLI command. For more information about any tool, use `seqnado tools <toolname>`.",
-        "",
-        "<!-- AUTO-GENERATED TOOL SECTIONS - DO NOT EDIT MANUALLY -->",
-        "<!-- This section is automatically updated by docs/scripts/generate_tool_citations.py -->",
-        "<!-- To update, run: python docs/scripts/generate_tool_citations.py --update -->",
-        "",
-    ]
-
-    # Organize tools by category
-    for category in categories:
-        category_tools = {
-            name: info
-            for name, info in tools.items()
-            if info.get("category") == category
-        }
+    yield "\n".join(
+        [
+            "## Tools",
+            "",
+            "Tools are organized by category, matching the structure of the `seqnado tools` CLI command. For more information about any tool, use `seqnado tools <toolname>`.",
+            "",
+            "<!-- AUTO-GENERATED TOOL SECTIONS - DO NOT EDIT MANUALLY -->",
+            "<!-- This section is automatically updated by docs/scripts/generate_tool_citations.py -->",
+            "<!-- To update, run: python docs/scripts/generate_tool_citations.py --update -->",
+            "",
+        ]
+    )
+
+    # Organize tools by category in a single pass over the tools. Sorting
+    # once up front leaves every bucket in alphabetical order. Category names
+    # are interned so the per-category lookups below hit on identity.
+    tools_by_category = defaultdict(list)
+    for name, info in sorted(tools.items()):
+        category = info.get("category")
+        for cat in category if isinstance(category, list) else [category]:
+            tools_by_category[sys.intern(cat or "")].append((name, info))
+
+    versions = _prefetch_versions(tools)
+
+    for category in map(sys.intern, categories):
+        category_tools = tools_by_category.get(category)
 
         if not category_tools:
             continue
 
-        lines.append(f"### {category}")
-        lines.append("")
+        yield f"\n### {category}\n"
 
-        # Sort tools alphabetically within category
-        for tool_name in sorted(category_tools.keys()):
-            tool_info = category_tools[tool_name]
-            entry = generate_tool_entry(tool_name, tool_info)
-            lines.append(entry)
+        for tool_name, tool_info in category_tools:
+            yield "\n" + generate_tool_entry(tool_name, tool_info, versions[tool_name])
 
-    return "\n".join(lines)
+
+def generate_tools_section() -> str:
+    """Generate the complete Tools section organized by category"""
+    return "".join(iter_tools_section())
+
+
+def _tail_lines(chunks: Iterable[str], n: int) -> List[str]:
+    """Return the last ``n`` lines of the concatenated chunks."""
+    tail = deque(maxlen=n)
+    partial = ""
+    for chunk in chunks:
+        pieces = (partial + chunk).split("\n")
+        partial = pieces.pop()
+        tail.extend(pieces)
+    tail.append(partial)
+    return list(tail)
+
+
+def _load_json(path: Path):
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _dump_json(path: Path, data) -> None:
+    """Write JSON with the 4-space layout tools.json is kept in.
+
+    orjson only indents by two spaces, so writing stays with the stdlib to
+    avoid reformatting the whole file on every version bump.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(data, indent=4))
+        f.write("\n")
 
 
 def update_tools_json(dry_run: bool = False) -> bool:
@@ -202,14 +290,14 @@ def update_tools_json(dry_run: bool = False) -> bool:
         print(f"Error: {json_path} does not exist", file=sys.stderr)
         return False
 
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _load_json(json_path)
 
     tools = data.get("tools", data)
     updated = 0
+    versions = _prefetch_versions(tools)
 
     for tool_name, tool_info in tools.items():
-        version = _get_tool_version_for_docs(tool_name)
+        version = versions[tool_name]
         if version and version != "Latest via container":
             old = tool_info.get("version")
             if old != version:
@@ -225,9 +313,7 @@ def update_tools_json(dry_run: bool = False) -> bool:
         print(f"\nDry run - {updated} version(s) would be updated in {json_path}")
         return True
 
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
-        f.write("\n")
+    _dump_json(json_path, data)
 
     print(f"Updated {updated} version(s) in {json_path}")
     return True
@@ -239,34 +325,39 @@ def update_tools_md(doc_path: Path, dry_run: bool = False) -> bool:
         print(f"Error: {doc_path} does not exist")
         return False
 
-    with open(doc_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    content = doc_path.read_text(encoding="utf-8")
 
     # Generate new tools section
     print("Generating tool sections from SeqNado API...")
-    tools_section = generate_tools_section()
+    tools_section = iter_tools_section()
 
     # Replace from "## Tools" to end of file
-    pattern = r"\n## Tools\n.*$"
+    marker_pos = content.find(TOOLS_SECTION_MARKER)
 
-    if re.search(pattern, content, re.DOTALL):
-        new_content = re.sub(pattern, "\n" + tools_section, content, flags=re.DOTALL)
+    if marker_pos >= 0:
+        chunks = chain([content[:marker_pos], "\n"], tools_section)
         print("Replaced existing Tools section")
     else:
         # Append to end
-        new_content = content.rstrip() + "\n\n" + tools_section + "\n"
+        chunks = chain([content.rstrip(), "\n\n"], tools_section, ["\n"])
         print("Appended new Tools section")
 
     if dry_run:
         print("\nDry run - changes not saved. Preview of updates:")
         print("=" * 80)
-        lines = new_content.split("\n")
-        print("\n".join(lines[-100:]))
+        print("\n".join(_tail_lines(chunks, 100)))
         print("=" * 80)
         return True
 
-    with open(doc_path, "w", encoding="utf-8") as f:
-        f.write(new_content)
+    # Stream the unchanged prefix and the generated section to a sibling file,
+    # then swap it in so a failure part-way through leaves citation.md intact
+    tmp_path = doc_path.with_name(doc_path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            f.writelines(chunks)
+        os.replace(tmp_path, doc_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
     print(f"Successfully updated {doc_path}")
     return True
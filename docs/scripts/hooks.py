@@ -23,22 +23,24 @@ def on_pre_build(config):
     
     if script_path.exists():
         print(f"Generating tool citations from BibTeX file...")
-        try:
-            result = subprocess.run(
-                [sys.executable, str(script_path), "--update"],
-                cwd=str(root_dir),
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            print(result.stdout)
-            if result.stderr:
-                print(result.stderr, file=sys.stderr)
-        except subprocess.CalledProcessError as e:
-            print(f"Error generating citations: {e}", file=sys.stderr)
-            print(e.stdout)
-            print(e.stderr, file=sys.stderr)
+        # Stream the generator's output as it runs rather than buffering it;
+        # its stderr goes straight through to ours
+        with subprocess.Popen(
+            [sys.executable, str(script_path), "--update"],
+            cwd=str(root_dir),
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        ) as proc:
+            for line in proc.stdout:
+                print(line, end="")
+        if proc.returncode:
             # Don't fail the build, just warn
+            print(
+                f"Error generating citations: {script_path} exited with "
+                f"status {proc.returncode}",
+                file=sys.stderr,
+            )
     else:
         print(f"Warning: Citation generator script not found at {script_path}")
     
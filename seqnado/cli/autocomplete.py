@@ -2,15 +2,29 @@
 
 from __future__ import annotations
 
+import functools
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import FrozenSet, List, Optional, Tuple
 
 
-def _assay_names() -> List[str]:
-    """Get list of available assay names for autocomplete."""
+@functools.lru_cache(maxsize=1)
+def _assay_clean_names() -> Tuple[str, ...]:
+    """All assay clean names; the Assay enum is fixed, so look them up once."""
     from seqnado.inputs import Assay  # local import to keep CLI startup snappy
 
-    return list(Assay.all_assay_clean_names())
+    return tuple(Assay.all_assay_clean_names())
+
+
+@functools.lru_cache(maxsize=1)
+def _assay_name_set() -> FrozenSet[str]:
+    """Assay clean names as a set, for membership tests."""
+    return frozenset(_assay_clean_names())
+
+
+def _assay_names() -> List[str]:
+    """Get list of available assay names for autocomplete."""
+    return list(_assay_clean_names())
 
 
 def assay_autocomplete(_: str) -> List[str]:
@@ -18,16 +32,41 @@ def assay_autocomplete(_: str) -> List[str]:
     return _assay_names()
 
 
+@functools.lru_cache(maxsize=128)
+def _fastq_names(directory: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Sorted *.fastq.gz file names in ``directory``.
+
+    ``mtime_ns`` is only part of the cache key, so adding or removing files
+    (which bumps the directory mtime) triggers a fresh scan.
+    """
+    with os.scandir(directory) as it:
+        return tuple(
+            sorted(e.name for e in it if e.name.endswith(".fastq.gz") and e.is_file())
+        )
+
+
 def fastq_autocomplete(incomplete: str) -> List[str]:
     """Provide FASTQ file suggestions without expensive globbing."""
-    p = Path(incomplete or ".")
-    base = p.parent if p.name else p
-    pattern = p.name or "*"
+    if not incomplete or incomplete.endswith(os.sep):
+        # Nothing typed yet inside this directory: offer all of it
+        base, prefix = Path(incomplete or "."), ""
+    else:
+        p = Path(incomplete)
+        base, prefix = p.parent, p.name
     try:
-        candidates = sorted(base.glob(pattern + "*.fastq.gz"))
-    except Exception:
-        candidates = []
-    return [str(x) for x in candidates if x.is_file()][:40]
+        names = _fastq_names(str(base), os.stat(base).st_mtime_ns)
+    except OSError:
+        return []
+    # With no prefix, leave out hidden (dot-prefixed) files; a typed prefix
+    # starting with "." still matches them explicitly
+    matches = [
+        name
+        for name in names
+        if name.startswith(prefix)
+        and len(name) >= len(prefix) + len(".fastq.gz")
+        and (prefix or not name.startswith("."))
+    ]
+    return [str(base / name) for name in matches[:40]]
 
 
 def _get_profile_name(fn: Path) -> Optional[str]:
@@ -49,23 +88,49 @@ def _profile_autocomplete() -> List[str]:
     return list(_preset_profiles().keys())
 
 
+def _fastq_entries(directory: str) -> List[os.DirEntry]:
+    """Return the *.fastq.gz files in ``directory``, sorted by name."""
+    try:
+        with os.scandir(directory) as it:
+            entries = [e for e in it if e.name.endswith(".fastq.gz") and e.is_file()]
+    except OSError:
+        return []
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
 def _find_fastqs(hints: List[str]) -> List[Path]:
     """
     Search the provided hint directories for *.fastq.gz files.
     Skip hints that don't exist and return a sorted list.
     Searches both directly in the hint directory and in subdirectories.
     """
-    seen: set[Path] = set()
+    seen: set[Tuple[int, int] | Path] = set()
     out: List[Path] = []
+
+    def _add(entry: os.DirEntry) -> None:
+        # Identify files by inode so symlinked duplicates are only listed once
+        try:
+            st = entry.stat()
+            key = (st.st_dev, st.st_ino)
+        except OSError:
+            key = Path(entry.path).resolve()
+        if key not in seen:
+            seen.add(key)
+            out.append(Path(entry.path))
+
     for loc in hints:
-        p = Path(loc)
-        if not p.exists():
+        if not os.path.isdir(loc):
             continue
         # Search directly in the directory and one level deeper
-        for pattern in ("*.fastq.gz", "*/*.fastq.gz"):
-            for f in sorted(p.glob(pattern)):
-                resolved = f.resolve()
-                if resolved not in seen:
-                    seen.add(resolved)
-                    out.append(f)
+        for entry in _fastq_entries(loc):
+            _add(entry)
+        try:
+            with os.scandir(loc) as it:
+                subdirs = sorted(e.path for e in it if e.is_dir())
+        except OSError:
+            continue
+        for sub in subdirs:
+            for entry in _fastq_entries(sub):
+                _add(entry)
     return out
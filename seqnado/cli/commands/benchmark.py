@@ -8,16 +8,6 @@ import typer
 from loguru import logger
 
 from seqnado.cli.app_instance import app
-from seqnado.cli.benchmark_helpers import (
-    compute_assay_output_sizes,
-    discover_snakemake_logs,
-    format_compact_number,
-    load_benchmark_table,
-    parse_alignment_processing_logs,
-    parse_snakemake_logs_timeline,
-    summarize_benchmarks,
-    write_html_report,
-)
 from seqnado.cli.utils import _configure_logging, cli_print_table, verbose_option
 
 
@@ -103,6 +93,17 @@ def run_benchmark_report(
     """Generate benchmark outputs from plain Python code without Typer option wrappers."""
     _configure_logging(verbose)
 
+    # Local import to keep CLI startup snappy
+    from seqnado.cli.benchmark_helpers import (
+        compute_assay_output_sizes,
+        discover_snakemake_logs,
+        load_benchmark_table,
+        parse_alignment_processing_logs,
+        parse_snakemake_logs_timeline,
+        summarize_benchmarks,
+        write_html_report,
+    )
+
     resolved_benchmark_dir = _resolve_benchmark_dir(benchmark_dir)
     if resolved_benchmark_dir is None:
         logger.error(
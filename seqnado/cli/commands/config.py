@@ -1,6 +1,8 @@
 """Build workflow configuration YAML command."""
 from __future__ import annotations
 
+import functools
+
 import typer
 from datetime import date
 from importlib import resources
@@ -14,6 +16,16 @@ from seqnado.cli.autocomplete import _assay_names, assay_autocomplete
 from seqnado.cli.utils import _configure_logging, _pkg_traversable, validate_assay, verbose_option
 
 
+@functools.lru_cache(maxsize=1)
+def _config_template():
+    """Packaged config template, located once per process.
+
+    Still pass it through resources.as_file(); for a regular install that is a
+    no-op, and for a zipped package it extracts a temporary copy.
+    """
+    return _pkg_traversable("seqnado.data").joinpath("config_template.jinja")
+
+
 @app.command(
     help="Build a workflow configuration YAML for the selected ASSAY. If no assay is provided, multiomics mode is used."
 )
@@ -101,9 +113,8 @@ def config(
             outdir = Path(".")
 
         # Render all config files
-        tpl_trav = _pkg_traversable("seqnado.data").joinpath("config_template.jinja")
         try:
-            with resources.as_file(tpl_trav) as tpl_path:
+            with resources.as_file(_config_template()) as tpl_path:
                 if not Path(tpl_path).exists():
                     logger.error(
                         "Packaged config template missing—installation may be corrupted."
@@ -157,9 +168,8 @@ def config(
         logger.info(f"Created output directory: {outdir / 'fastqs'}")
         config_output = output or (outdir / f"config_{assay_obj.clean_name}.yaml")
 
-    tpl_trav = _pkg_traversable("seqnado.data").joinpath("config_template.jinja")
     try:
-        with resources.as_file(tpl_trav) as tpl_path:
+        with resources.as_file(_config_template()) as tpl_path:
             if not Path(tpl_path).exists():
                 logger.error(
                     "Packaged config template missing—installation may be corrupted."
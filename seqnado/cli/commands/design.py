@@ -1,7 +1,9 @@
 """Generate SeqNado design CSV from FASTQ files command."""
 from __future__ import annotations
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
@@ -10,9 +12,10 @@ from loguru import logger
 
 from seqnado import Assay
 from seqnado.cli.app_instance import app
-from seqnado.cli.autocomplete import _find_fastqs, _assay_names, fastq_autocomplete, assay_autocomplete
+from seqnado.cli.autocomplete import _assay_name_set, _fastq_entries, _find_fastqs, _assay_names, fastq_autocomplete, assay_autocomplete
 from seqnado.cli.utils import (
     _configure_logging,
+    _write_csv,
     validate_assay,
     generate_design_dataframe,
     verbose_option,
@@ -28,14 +31,13 @@ def _parse_ip_to_control_pairings(
     """
     pairings = {}
     for pair in pairing_str.split(","):
-        try:
-            ip, control = pair.split(":")
-            pairings[ip.strip()] = control.strip()
-        except ValueError:
+        ip, sep, control = pair.partition(":")
+        if not sep or ":" in control:
             logger.error(
                 f"Invalid ip-to-control pairing format: '{pair}'. Expected 'antibody:control'."
             )
             raise typer.Exit(code=2)
+        pairings[ip.strip()] = control.strip()
     return pairings
 
 
@@ -116,7 +118,6 @@ def design(
     # Local imports
     import pandas as pd
 
-    from seqnado.inputs import Assay as AssayEnum
     from seqnado.inputs import FastqCollection, FastqCollectionForIP
     from seqnado.inputs.validation import DesignDataFrame
 
@@ -140,23 +141,30 @@ def design(
             raise typer.Exit(code=1)
 
         # Find all subdirectories in fastqs/ that match known assay names
-        available_assays = AssayEnum.all_assay_clean_names()
+        available_assays = _assay_name_set()
         found_assay_dirs = {}
 
-        for assay_dir in fastqs_base.iterdir():
-            if assay_dir.is_dir() and assay_dir.name in available_assays:
-                # Check if there are any fastq files in this directory
-                fastq_files = list(assay_dir.glob("*.fastq.gz"))
-                if fastq_files:
-                    found_assay_dirs[assay_dir.name] = fastq_files
-                    logger.info(f"Found {len(fastq_files)} FASTQ files in {assay_dir}")
+        with os.scandir(fastqs_base) as it:
+            assay_dirs = [e for e in it if e.name in available_assays and e.is_dir()]
+
+        # Folder listings are I/O-bound (often on network filesystems), so
+        # scan the assay folders concurrently
+        with ThreadPoolExecutor(max_workers=min(16, len(assay_dirs) or 1)) as executor:
+            listings = executor.map(_fastq_entries, [e.path for e in assay_dirs])
+
+        for assay_dir, entries in zip(assay_dirs, listings):
+            # Check if there are any fastq files in this directory
+            fastq_files = [Path(e.path) for e in entries]
+            if fastq_files:
+                found_assay_dirs[assay_dir.name] = fastq_files
+                logger.info(f"Found {len(fastq_files)} FASTQ files in {assay_dir.path}")
 
         if not found_assay_dirs:
             logger.error(
                 "No FASTQ files found in any assay subdirectories under fastqs/"
             )
             logger.info("Expected structure: fastqs/{assay}/{files}.fastq.gz")
-            logger.info(f"Valid assay names: {', '.join(available_assays)}")
+            logger.info(f"Valid assay names: {', '.join(_assay_names())}")
             raise typer.Exit(code=1)
 
         # Generate metadata for each assay
@@ -173,10 +181,9 @@ def design(
                 deseq2_pattern=deseq2_pattern,
             )
 
-            # Save metadata file
+            # Save metadata file (in the current directory, which exists)
             metadata_file = Path(f"metadata_{assay_name}.csv")
-            metadata_file.parent.mkdir(parents=True, exist_ok=True)
-            df.to_csv(metadata_file, index=False)
+            _write_csv(df, metadata_file)
             generated_files.append(metadata_file)
             logger.success(f"Design file saved → {metadata_file}")
 
@@ -189,10 +196,7 @@ def design(
     # Regular single-assay mode
     validate_assay(assay)
 
-    fastq_paths: List[Path] = []
-    for p in files or []:
-        if p.suffixes[-2:] == [".fastq", ".gz"]:
-            fastq_paths.append(p)
+    fastq_paths: List[Path] = [p for p in files or [] if p.name.endswith(".fastq.gz")]
 
     if not fastq_paths and auto_discover:
         hints = [".", "fastqs", "fastq", "data", "data/fastqs"]
@@ -233,18 +237,32 @@ def design(
             # Treat group_by as a regex pattern to extract from sample_id
             try:
                 # For IP assays (ChIP, CAT), concatenate sample_id and ip
+                # while walking plain lists, without building an interim Series
                 if assay and assay.lower() in ["chip", "cat"]:
-                    samples = df["sample_id"] + df["ip"]
+                    samples = [
+                        s + ip if isinstance(s, str) and isinstance(ip, str) else None
+                        for s, ip in zip(df["sample_id"].tolist(), df["ip"].tolist())
+                    ]
                 else:
-                    samples = df["sample_id"]
+                    samples = df["sample_id"].tolist()
 
-                df["consensus_group"] = samples.str.extract(group_by, expand=False)
-                if df["consensus_group"].isnull().all():
+                pattern = re.compile(group_by)
+                if pattern.groups != 1:
+                    raise ValueError(
+                        f"Regex '{group_by}' must contain exactly one capture group"
+                    )
+                groups = [
+                    m.group(1) if isinstance(s, str) and (m := pattern.search(s)) else None
+                    for s in samples
+                ]
+                if all(g is None for g in groups):
                     raise ValueError(
                         f"No matches found with the provided regex '{group_by}'"
                     )
 
-                df["consensus_group"] = df["consensus_group"].fillna("unknown")
+                df["consensus_group"] = [
+                    "unknown" if g is None else g for g in groups
+                ]
                 logger.info(
                     f"Grouped samples by regex '{group_by}' into 'consensus_group'."
                 )
@@ -253,5 +271,5 @@ def design(
                 raise typer.Exit(code=3)
 
     output.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output, index=False)
+    _write_csv(df, output)
     logger.success(f"Design file saved → {output}")
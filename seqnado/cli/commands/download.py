@@ -1,6 +1,7 @@
 """Download FASTQ files from GEO/SRA command."""
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
 from importlib import resources
@@ -11,11 +12,12 @@ import typer
 from loguru import logger
 
 from seqnado.cli.app_instance import app
-from seqnado.cli.autocomplete import assay_autocomplete
+from seqnado.cli.autocomplete import _fastq_entries, assay_autocomplete
 from seqnado.cli.snakemake_builder import SnakemakeCommandBuilder
 from seqnado.cli.utils import (
     _configure_logging,
     _pkg_traversable,
+    _write_csv,
     require_snakemake,
     generate_design_dataframe,
     resolve_profile,
@@ -97,12 +99,6 @@ def download(
     """
     _configure_logging(verbose)
 
-    # Local imports
-    import pandas as pd
-    import yaml
-
-    from seqnado.inputs import Assay as AssayEnum
-
     require_snakemake()
 
     # Log assay parameter early if provided
@@ -111,18 +107,32 @@ def download(
 
     # Read and parse metadata TSV
     logger.info(f"Reading metadata from {metadata_tsv}")
+
+    # Local import, only once the cheap checks have passed
+    import pandas as pd
+
     try:
-        samples_df = pd.read_csv(metadata_tsv, sep="\t")
         required_cols = ["run_accession", "sample_title", "library_name"]
-        missing_cols = [col for col in required_cols if col not in samples_df.columns]
+        # GEO/ENA file reports carry dozens of free-text columns; only parse
+        # the ones used here, as strings, to skip per-column type inference
+        wanted_cols = {*required_cols, "library_layout"}
+        samples_df = pd.read_csv(
+            metadata_tsv,
+            sep="\t",
+            usecols=lambda col: col in wanted_cols,
+            dtype=str,
+        )
+        present_cols = set(samples_df.columns)
+        missing_cols = [col for col in required_cols if col not in present_cols]
         if missing_cols:
+            all_cols = pd.read_csv(metadata_tsv, sep="\t", nrows=0).columns
             logger.error(f"Missing required columns in TSV: {', '.join(missing_cols)}")
             logger.info(f"Required columns: {', '.join(required_cols)}")
-            logger.info(f"Available columns: {', '.join(samples_df.columns)}")
+            logger.info(f"Available columns: {', '.join(all_cols)}")
             raise typer.Exit(code=1)
 
         # Check for library_layout column
-        has_layout = "library_layout" in samples_df.columns
+        has_layout = "library_layout" in present_cols
         if not has_layout:
             logger.warning(
                 "No 'library_layout' column found in TSV. "
@@ -140,16 +150,29 @@ def download(
     geo_samples_single = {}
     geo_samples_unknown = {}
 
-    for _, row in samples_df.iterrows():
-        sample_name = f"{row['library_name']}-{row['sample_title']}"
+    # Walk the columns as plain Python lists rather than boxing each row
+    # into a Series with iterrows()
+    layouts = (
+        samples_df["library_layout"].astype(str).str.upper().tolist()
+        if has_layout
+        else [None] * len(samples_df)
+    )
+    rows = zip(
+        samples_df["run_accession"].tolist(),
+        samples_df["library_name"].tolist(),
+        samples_df["sample_title"].tolist(),
+        layouts,
+    )
+
+    for srr, gsm, sample, layout in rows:
+        sample_name = f"{gsm}-{sample}"
         sample_info = {
-            "srr": row["run_accession"],
-            "gsm": row["library_name"],
-            "sample": row["sample_title"],
+            "srr": srr,
+            "gsm": gsm,
+            "sample": sample,
         }
 
         if has_layout:
-            layout = str(row["library_layout"]).upper()
             if layout == "PAIRED":
                 geo_samples_paired[sample_name] = sample_info
             elif layout == "SINGLE":
@@ -186,10 +209,24 @@ def download(
         "geo_outdir": str(outdir.resolve()),
     }
 
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as SafeDumper
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeDumper
+
     config_file = Path("seqnado_output/logs/geo_download/geo_download_config.yaml")
     config_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(config_file, "w") as f:
-        yaml.dump(temp_config, f)
+    # Write a sibling and swap it in, so a failed dump never leaves a
+    # truncated config behind for the next run
+    tmp_config = config_file.with_name(config_file.name + ".tmp")
+    try:
+        with open(tmp_config, "w") as f:
+            yaml.dump(temp_config, f, Dumper=SafeDumper, default_flow_style=False)
+        os.replace(tmp_config, config_file)
+    finally:
+        tmp_config.unlink(missing_ok=True)
 
     # Get the download.smk file from package
     pkg_root_trav = _pkg_traversable("seqnado")
@@ -255,7 +292,7 @@ def download(
             logger.info(f"\nGenerating design file for {assay}...")
 
             # Find downloaded FASTQ files
-            fastq_files = sorted(outdir.glob("*.fastq.gz"))
+            fastq_files = [Path(e.path) for e in _fastq_entries(outdir)]
             if not fastq_files:
                 logger.error(f"No FASTQ files found in {outdir}")
                 raise typer.Exit(code=1)
@@ -276,5 +313,5 @@ def download(
                 design_output = outdir / f"metadata_{assay}.csv"
 
             design_output.parent.mkdir(parents=True, exist_ok=True)
-            df.to_csv(design_output, index=False)
+            _write_csv(df, design_output)
             logger.success(f"Design file saved → {design_output}")
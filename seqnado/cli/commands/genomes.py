@@ -106,6 +106,23 @@ def edit_genomes(
         )
         raise typer.Exit(code=4)
 
+    if sys.platform != "win32":
+        # Hand the process over to the editor rather than keeping Python
+        # resident while it runs; the editor's exit status becomes ours
+        typer.echo(f"Editing genome config: {cfg_path}")
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            os.execvp(editor_cmd[0], editor_cmd + [str(cfg_path)])
+        except FileNotFoundError:
+            logger.error(
+                f"Editor '{editor_cmd[0]}' not found. Please set $EDITOR to your preferred editor."
+            )
+            raise typer.Exit(code=4)
+        except OSError as e:
+            logger.error(f"Failed to launch editor: {e}")
+            raise typer.Exit(code=5)
+
     try:
         subprocess.check_call(editor_cmd + [str(cfg_path)])
     except subprocess.CalledProcessError as e:
@@ -241,7 +258,7 @@ def build_genomes(
             logger.info(f"Output directory: {outdir}")
             
             # Execute snakemake
-            cwd = str(Path(".").resolve())
+            cwd = str(Path.cwd())
             exit_code = execute_snakemake(cmd, cwd, verbose)
             raise typer.Exit(code=exit_code)
 
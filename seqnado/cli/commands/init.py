@@ -1,8 +1,11 @@
 """Initialize SeqNado user environment command."""
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import shutil
+import socket
 import subprocess
 from importlib import resources
 from pathlib import Path
@@ -14,20 +17,66 @@ from seqnado.cli.app_instance import app
 from seqnado.cli.utils import (
     _configure_logging,
     _pkg_traversable,
-    _read_json,
-    _write_json,
+    _read_packaged_bytes,
+    _write_bytes,
     dry_run_option,
     verbose_option,
 )
 from seqnado.utils import get_preset_profiles
 
+_COPY_BUFSIZE = 1024 * 1024
+
+
+def _matches_template(config_bytes: bytes, template_bytes: bytes) -> bool:
+    """
+    Return True if a genome config is an untouched copy of the template.
+
+    A verbatim byte match is the fast path; otherwise both documents are
+    parsed so configs written by older releases (re-serialized JSON) still
+    count as untouched. Raises ValueError if the config is not valid JSON.
+    """
+    if config_bytes == template_bytes:
+        return True
+    config_data = json.loads(config_bytes)
+    return config_data == json.loads(template_bytes)
+
+
+def _init_sh_stamp(script: bytes) -> str:
+    """
+    Key for the last successful init.sh run.
+
+    Covers the script itself plus the inputs it reads: the hostname (CCB
+    detection), $APPTAINER_BINDPATH and the user's Apptainer remote config.
+    """
+    digest = hashlib.sha256(script)
+    digest.update(b"\0" + socket.gethostname().encode())
+    digest.update(b"\0" + os.environ.get("APPTAINER_BINDPATH", "").encode())
+    remote_config = Path(os.path.expanduser("~"), ".apptainer", "remote.yaml")
+    try:
+        digest.update(b"\0" + remote_config.read_bytes())
+    except OSError:
+        pass
+    return digest.hexdigest()
+
+
+def _copy_profile_tree(src: Path, dest: Path) -> None:
+    """Copy a packaged profile directory into place in a single walk."""
+    for root, _dirs, files in os.walk(src):
+        target = dest.joinpath(os.path.relpath(root, src))
+        target.mkdir(parents=True, exist_ok=True)
+        for name in files:
+            with open(os.path.join(root, name), "rb") as fsrc, open(
+                target.joinpath(name), "wb"
+            ) as fdst:
+                shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+
 
 @app.command(
     help="""
 Initialize SeqNado user environment.
 
 - Logs the current Conda environment if active (optional).
-- Runs packaged Apptainer/Singularity init (if `apptainer` on PATH).
+- Runs packaged Apptainer/Singularity init (if `apptainer` on PATH and the script, host or Apptainer settings changed).
 - Ensures ~/.config/seqnado/genome_config.json exists (template or preset).
 """
 )
@@ -35,6 +84,11 @@ def init(
     preset: bool = typer.Option(
         False, help="Use packaged preset genomes instead of the editable template."
     ),
+    force_init: bool = typer.Option(
+        False,
+        "--force-init",
+        help="Re-run the Apptainer init script even if nothing it depends on has changed since the last run.",
+    ),
     dry_run: bool = dry_run_option(),
     verbose: bool = verbose_option(),
 ) -> None:
@@ -42,125 +96,169 @@ def init(
     Initialize SeqNado user environment.
 
     - Logs the current Conda environment if active (optional).
-    - Runs packaged Apptainer/Singularity init (if `apptainer` on PATH).
+    - Runs packaged Apptainer/Singularity init (if `apptainer` on PATH and the script, host or Apptainer settings changed).
     - Ensures ~/.config/seqnado/genome_config.json exists (template or preset).
     """
     _configure_logging(verbose)
 
     conda_env = os.environ.get("CONDA_DEFAULT_ENV")
-    logger.info(f"Conda environment: {conda_env or 'none'}")
+    logger.info("Conda environment: {}", conda_env or "none")
+
+    # Resolve HOME once; both config locations live under ~/.config
+    config_root = Path(os.path.expanduser("~"), ".config")
+    cfg_dir = config_root / "seqnado"
+    cfg_dir.mkdir(parents=True, exist_ok=True)
 
     # Apptainer/Singularity bootstrap
     if shutil.which("apptainer"):
+        # Records the key of the last init.sh run that succeeded
+        init_stamp = cfg_dir.joinpath(".init_sh.sha256")
         init_script_trav = _pkg_traversable("seqnado").joinpath("init.sh")
         try:
             with resources.as_file(init_script_trav) as init_script:
-                if init_script.exists():
-                    logger.info(f"Configuring Apptainer/Singularity via {init_script}")
-                    if not dry_run:
+                if not init_script.exists():
+                    logger.warning(
+                        "Apptainer init script not found in package; skipping."
+                    )
+                else:
+                    script = init_script.read_bytes()
+                    if (
+                        not force_init
+                        and init_stamp.exists()
+                        and init_stamp.read_text().strip() == _init_sh_stamp(script)
+                    ):
+                        logger.info(
+                            "Apptainer already configured by this init script; skipping "
+                            "(use --force-init to re-run)."
+                        )
+                        if not os.environ.get("APPTAINER_BINDPATH"):
+                            logger.warning(
+                                "Please set the APPTAINER_BINDPATH environment variable "
+                                "to bind the necessary directories."
+                            )
+                    elif dry_run:
+                        logger.info("[dry-run] Would execute: bash {}", init_script)
+                    else:
+                        logger.info(
+                            "Configuring Apptainer/Singularity via {}", init_script
+                        )
                         try:
                             subprocess.run(["bash", str(init_script)], check=True)
+                            # Re-key after the run: the script may add a remote
+                            init_stamp.write_text(_init_sh_stamp(script))
                         except subprocess.CalledProcessError as e:
                             logger.warning(
-                                f"Apptainer init script failed (continuing): {e}"
+                                "Apptainer init script failed (continuing): {}",
+                                e,
                             )
                         except Exception as e:
-                            logger.warning(f"Skipping Apptainer init due to error: {e}")
-                    else:
-                        logger.info(f"[dry-run] Would execute: bash {init_script}")
-                else:
-                    logger.warning(
-                        "Apptainer init script not found in package; skipping."
-                    )
+                            logger.warning(
+                                "Skipping Apptainer init due to error: {}", e
+                            )
         except Exception as e:
-            logger.warning("Could not access package init script: %s", e)
+            logger.warning("Could not access package init script: {}", e)
     else:
         logger.info("Apptainer not found on PATH; skipping container setup.")
 
     # Genome config
-    cfg_dir = Path.home().joinpath(".config", "seqnado")
-    cfg_dir.mkdir(parents=True, exist_ok=True)
     genome_config = cfg_dir.joinpath("genome_config.json")
 
     data_pkg = "seqnado.data"
     template_genomes = "preset_genomes.json"
     template_config = "genomes_template.json"
     template_name = template_genomes if preset else template_config
-    template_trav = _pkg_traversable(data_pkg).joinpath(template_name)
-    template_config_trav = _pkg_traversable(data_pkg).joinpath(template_config)
 
     # move to ~/.config/snakemake.
-    profile_target_dir = Path.home().joinpath(".config", "snakemake")
+    profile_target_dir = config_root / "snakemake"
     profile_target_dir.mkdir(parents=True, exist_ok=True)
     profiles = get_preset_profiles()
-    for profile in profiles.values():
-        profile_src_trav = _pkg_traversable("seqnado.workflow.envs.profiles").joinpath(
-            profile
-        )
-        profile_dest = profile_target_dir.joinpath(profile)
-        if profile_dest.exists():
-            logger.info(f"Snakemake profile already exists: {profile_dest}")
-            continue
-        try:
-            with resources.as_file(profile_src_trav) as profile_src:
+    try:
+        with resources.as_file(
+            _pkg_traversable("seqnado.workflow.envs.profiles")
+        ) as profiles_root:
+            existing_profiles = set(os.listdir(profile_target_dir))
+            for profile in profiles.values():
+                profile_dest = profile_target_dir.joinpath(profile)
+                if profile in existing_profiles:
+                    logger.info("Snakemake profile already exists: {}", profile_dest)
+                    continue
                 if dry_run:
                     logger.info(
-                        f"[dry-run] Would copy Snakemake profile {profile_src.name} to {profile_dest}"
+                        "[dry-run] Would copy Snakemake profile {} to {}",
+                        profile,
+                        profile_dest,
                     )
-                else:
-                    shutil.copytree(profile_src, profile_dest)
-                    logger.info(f"Copied Snakemake profile to {profile_dest}")
-        except Exception as e:
-            logger.error(f"Failed to copy Snakemake profile {profile}: {e}")
+                    continue
+                try:
+                    _copy_profile_tree(profiles_root.joinpath(profile), profile_dest)
+                    logger.info("Copied Snakemake profile to {}", profile_dest)
+                except Exception as e:
+                    logger.error("Failed to copy Snakemake profile {}: {}", profile, e)
+    except Exception as e:
+        logger.error("Could not access packaged Snakemake profiles: {}", e)
 
     if genome_config.exists():
-        logger.info(f"Found genome config: {genome_config}")
+        logger.info("Found genome config: {}", genome_config)
         try:
-            genome_data = _read_json(genome_config)
+            template_bytes = _read_packaged_bytes(data_pkg, template_config)
         except Exception as e:
-            logger.warning(
-                f"Could not parse existing genome config ({e}); leaving as-is."
-            )
-            genome_data = None
-
-        try:
-            with resources.as_file(template_config_trav) as template_path:
-                template_data = _read_json(Path(template_path))
-            if genome_data == template_data:
+            logger.debug("Could not read packaged template to compare: {}", e)
+        else:
+            try:
+                config_bytes = genome_config.read_bytes()
+            except OSError as e:
                 logger.warning(
-                    "Genome config matches the template exactly. Please update paths as needed."
+                    "Could not read existing genome config ({}); leaving as-is.", e
                 )
             else:
-                logger.info("Genome config appears to be customized; leaving as-is.")
-        except Exception as e:
-            logger.debug("Could not read packaged template to compare: %s", e)
-    else:
-        try:
-            with resources.as_file(template_trav) as template_path:
-                if not Path(template_path).exists():
-                    logger.error(
-                        "Packaged genome templates missing—installation may be corrupted."
-                    )
-                    raise typer.Exit(code=1)
-                if dry_run:
-                    logger.info(
-                        f"[dry-run] Would create {genome_config} from {template_path.name}"
+                try:
+                    matches = _matches_template(config_bytes, template_bytes)
+                except ValueError as e:
+                    logger.warning(
+                        "Could not parse existing genome config ({}); leaving as-is.", e
                     )
                 else:
-                    template = _read_json(Path(template_path))
-                    _write_json(genome_config, template)
-                    logger.info(
-                        "Created genome config "
-                        + (
-                            "from preset genomes."
-                            if preset
-                            else "template (please update paths)."
+                    if matches:
+                        logger.warning(
+                            "Genome config matches the template exactly. Please update paths as needed."
+                        )
+                    else:
+                        logger.info(
+                            "Genome config appears to be customized; leaving as-is."
                         )
+    else:
+        try:
+            template = _read_packaged_bytes(data_pkg, template_name)
+        except FileNotFoundError:
+            logger.error(
+                "Packaged genome templates missing—installation may be corrupted."
+            )
+            raise typer.Exit(code=1)
+        except Exception as e:
+            logger.error(
+                "Failed to read packaged genome template {}: {}", template_name, e
+            )
+            raise typer.Exit(code=1)
+
+        try:
+            if dry_run:
+                logger.info(
+                    "[dry-run] Would create {} from {}",
+                    genome_config,
+                    template_name,
+                )
+            else:
+                _write_bytes(genome_config, template)
+                logger.info(
+                    "Created genome config "
+                    + (
+                        "from preset genomes."
+                        if preset
+                        else "template (please update paths)."
                     )
-        except typer.Exit:
-            raise
+                )
         except Exception as e:
-            logger.error(f"Failed to write genome config: {e}")
+            logger.error("Failed to write genome config: {}", e)
             raise typer.Exit(code=1)
 
     logger.success("Initialization complete.")
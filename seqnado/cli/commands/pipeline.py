@@ -14,24 +14,29 @@ from loguru import logger
 from seqnado.cli.app_instance import app
 from seqnado.cli.autocomplete import assay_autocomplete
 from seqnado.cli.commands.benchmark import run_benchmark_report
-from seqnado.cli.snakemake_builder import SnakemakeCommandBuilder
 from seqnado.cli.utils import (
     _configure_logging,
     _pkg_traversable,
     require_snakemake,
     TOP_LEVEL_PASS_THROUGH,
-    execute_snakemake,
-    resolve_profile,
-    print_logo,
     verbose_option,
     preset_option,
 )
-from seqnado.outputs.multiomics import find_assay_config_paths
-from seqnado.utils import (
-    resolve_profile_path,
-    extract_cores_from_options,
-    create_flag_filter,
-)
+from seqnado.utils import extract_cores_from_options
+
+_TOP_LEVEL_SET = frozenset(TOP_LEVEL_PASS_THROUGH)
+
+# A regular install exposes the package as a plain Path; zip/namespace
+# installs do not and still need resources.as_file() per file.
+_PKG_TRAV = _pkg_traversable("seqnado")
+_PKG_ROOT: Optional[Path] = _PKG_TRAV if isinstance(_PKG_TRAV, Path) else None
+
+
+def _workflow_file(name: str) -> contextlib.AbstractContextManager:
+    """Return a context manager yielding a filesystem Path to a packaged workflow file."""
+    if _PKG_ROOT is not None:
+        return contextlib.nullcontext(_PKG_ROOT / "workflow" / name)
+    return resources.as_file(_PKG_TRAV.joinpath("workflow").joinpath(name))
 
 
 def _ensure_default_snakemake_flag(options: List[str], flag: str) -> List[str]:
@@ -83,35 +88,39 @@ def _run_multiomics_pipeline(
     Returns:
         Exit code from subprocess.run()
     """
-    logger.info(f"Multiomic mode detected: found {len(config_files)} config files")
-    logger.info(f"Assays: {', '.join([a.value for a in config_files])}")
+    from seqnado.cli.snakemake_builder import SnakemakeCommandBuilder
+    from seqnado.cli.utils import execute_snakemake, resolve_profile
+
+    logger.info("Multiomic mode detected: found {} config files", len(config_files))
+    logger.opt(lazy=True).info(
+        "Assays: {}", lambda: ", ".join(a.value for a in config_files)
+    )
     
-    snake_trav = pkg_root_trav.joinpath("workflow").joinpath("Snakefile_multi")
     profile_ctx, profile_path, is_custom = resolve_profile(preset, profile, pkg_root_trav)
     
     try:
         with (
-            resources.as_file(snake_trav) as snakefile_path,
+            _workflow_file("Snakefile_multi") as snakefile_path,
             profile_ctx as resolved_profile_path,
         ):
             # Use resolved_profile_path from context if profile_path was None (Traversable case)
             final_profile_path = profile_path or resolved_profile_path
                 
-            if not Path(snakefile_path).exists():
-                logger.error(f"Snakefile_multi not found: {snakefile_path}")
+            if not snakefile_path.exists():
+                logger.error("Snakefile_multi not found: {}", snakefile_path)
                 raise typer.Exit(code=1)
 
             # Initialize builder
-            builder = SnakemakeCommandBuilder(Path(snakefile_path), cores)
+            builder = SnakemakeCommandBuilder(snakefile_path, cores)
             
             # Build workflow_args for nested Snakemake runs
             workflow_args: List[str] = []
             
             # Nested workflow should get profile and default-resources if applicable
             if final_profile_path:
-                workflow_args.append(f"--profile {final_profile_path}")
+                workflow_args.extend(["--profile", str(final_profile_path)])
             if queue and preset and preset.startswith("s"):
-                workflow_args.append(f"--default-resources slurm_partition={queue}")
+                workflow_args.extend(["--default-resources", f"slurm_partition={queue}"])
             
             # Always enable these nested-run friendly flags
             workflow_args.extend(
@@ -127,10 +136,11 @@ def _run_multiomics_pipeline(
             
             # Policy: some flags must also be present on the top-level snakemake invocation.
             # TOP_LEVEL_PASS_THROUGH can be adjusted if you want more/fewer flags forwarded.
-            should_pass_to_top_level = create_flag_filter(TOP_LEVEL_PASS_THROUGH)
-            
-            # Filter cleaned_opts into top-level opts (preserving order)
-            top_level_opts = [o for o in cleaned_opts if should_pass_to_top_level(o)]
+            # Filter cleaned_opts into top-level opts (preserving order); `--flag=value`
+            # matches on the part before "=".
+            top_level_opts = [
+                o for o in cleaned_opts if o.split("=", 1)[0] in _TOP_LEVEL_SET
+            ]
             
             # Add top-level opts to builder
             if top_level_opts:
@@ -147,10 +157,12 @@ def _run_multiomics_pipeline(
             if profile_path:
                 builder.add_profile_from_path(profile_path)
                 if profile:
-                    logger.info(f"Using custom Snakemake profile: {profile_path}")
+                    logger.info("Using custom Snakemake profile: {}", profile_path)
                 else:
                     logger.info(
-                        f"Using Snakemake profile preset '{preset}' -> {profile_path}"
+                        "Using Snakemake profile preset '{}' -> {}",
+                        preset,
+                        profile_path,
                     )
             
             # Run in project directory for multiomics to avoid lock conflicts
@@ -167,7 +179,7 @@ def _run_multiomics_pipeline(
     except typer.Exit:
         raise
     except Exception as e:
-        logger.exception("Failed to run multiomics snakemake: %s", e)
+        logger.exception("Failed to run multiomics snakemake: {}", e)
         raise typer.Exit(code=1)
 
 
@@ -240,13 +252,21 @@ def pipeline(
     if show_version:
         from importlib.metadata import version as _pkg_version
 
-        logger.info(f"SeqNado version {_pkg_version('seqnado')}")
+        logger.info("SeqNado version {}", _pkg_version("seqnado"))
         raise typer.Exit(code=0)
 
     require_snakemake()
 
+    from seqnado.cli.snakemake_builder import SnakemakeCommandBuilder
+    from seqnado.cli.utils import (
+        _cached_assay_configs,
+        execute_snakemake,
+        print_logo,
+        resolve_profile,
+    )
+
     # Detect multiomics configs early
-    config_files = find_assay_config_paths(Path("."))
+    config_files = _cached_assay_configs(Path("."))
     use_multiomics = len(config_files) > 1 and not config_file and not assay
 
     # If the user accidentally put a flag into the assay position (e.g. `-n`),
@@ -282,20 +302,27 @@ def pipeline(
     if use_multiomics:
         cores = max(cores, len(config_files))
 
-    os.environ["SCALE_RESOURCES"] = str(scale_resources)
+    scale = str(scale_resources)
+    if os.environ.get("SCALE_RESOURCES") != scale:
+        os.environ["SCALE_RESOURCES"] = scale
 
     if clean_symlinks:
         # If assay is None (multiomics), we still have to pick a path; skip if not present
         if assay:
-            target = Path(f"seqnado_output/{assay}/fastqs")
-            logger.info(f"Cleaning symlinks in {target} ...")
-            for link in target.glob("*"):
-                if link.is_symlink():
-                    link.unlink(missing_ok=True)
+            target = f"seqnado_output/{assay}/fastqs"
+            logger.info("Cleaning symlinks in {} ...", target)
+            try:
+                with os.scandir(target) as it:
+                    for entry in it:
+                        if entry.is_symlink():
+                            with contextlib.suppress(FileNotFoundError):
+                                os.unlink(entry.path)
+            except FileNotFoundError:
+                logger.debug("No symlink directory at {}; nothing to clean.", target)
         else:
             logger.info("clean_symlinks requested but no assay specified; skipping.")
 
-    pkg_root_trav = _pkg_traversable("seqnado")
+    pkg_root_trav = _PKG_TRAV
 
     # Dispatch to multiomics if detected
     if use_multiomics:
@@ -315,12 +342,12 @@ def pipeline(
         raise typer.Exit(code=exit_code)
 
     # Single-assay mode
-    snake_trav = pkg_root_trav.joinpath("workflow").joinpath("Snakefile")
     if not config_file:
         config_file = Path(f"config_{assay}.yaml")
         if not config_file.exists():
             logger.error(
-                f"No config file provided and default not found: {config_file}"
+                "No config file provided and default not found: {}",
+                config_file,
             )
             raise typer.Exit(code=1)
 
@@ -328,20 +355,22 @@ def pipeline(
 
     try:
         with (
-            resources.as_file(snake_trav) as snakefile_path,
+            _workflow_file("Snakefile") as snakefile_path,
             profile_ctx as resolved_profile_path,
         ):
             # Use resolved_profile_path from context if profile_path was None (Traversable case)
             final_profile_path = profile_path or resolved_profile_path
                 
-            if not Path(snakefile_path).exists():
+            if not snakefile_path.exists():
                 logger.error(
-                    f"Snakefile for assay '{assay}' not found: {snakefile_path}"
+                    "Snakefile for assay '{}' not found: {}",
+                    assay,
+                    snakefile_path,
                 )
                 raise typer.Exit(code=1)
 
             # Initialize builder for single-assay mode
-            builder = SnakemakeCommandBuilder(Path(snakefile_path), cores)
+            builder = SnakemakeCommandBuilder(snakefile_path, cores)
             
             # Add configfile
             builder.add_configfile(config_file)
@@ -371,5 +400,5 @@ def pipeline(
     except typer.Exit:
         raise
     except Exception as e:
-        logger.exception("Failed to run snakemake: %s", e)
+        logger.exception("Failed to run snakemake: {}", e)
         raise typer.Exit(code=1)
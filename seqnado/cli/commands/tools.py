@@ -75,12 +75,11 @@ def tools(
     from seqnado.tools import (
         format_citation,
         get_tool_citation,
-        get_tool_help,
         get_tool_info,
         get_tool_subcommands,
-        get_tool_version,
+        get_tool_version_and_help,
         is_apptainer_available,
-        run_tool_help_in_container,
+        iter_tool_help_in_container,
     )
     from seqnado.tools import (
         list_tools as list_all_tools,
@@ -116,11 +115,11 @@ def tools(
             )
 
         logger.info(f"Fetching help for '{tool_name}' from SeqNado container...")
-        help_output = run_tool_help_in_container(tool_name, subcommand=subcommand)
-        if _RICH_CONSOLE:
-            _RICH_CONSOLE.print(help_output)
-        else:
-            typer.echo(help_output)
+        for line in iter_tool_help_in_container(tool_name, subcommand=subcommand):
+            if _RICH_CONSOLE:
+                _RICH_CONSOLE.print(line)
+            else:
+                typer.echo(line)
         raise typer.Exit(code=0)
 
     # If --citation is requested, show BibTeX entry
@@ -176,6 +175,13 @@ def tools(
     if subcommand:
         subcommand = _validate_subcommand(tool_name, subcommand, subcommands)
 
+    # One container start covers both version and help when both need it
+    version_info, help_text = get_tool_version_and_help(
+        tool_name,
+        use_container=is_apptainer_available(),
+        subcommand=subcommand,
+    )
+
     # Display tool information
     if _RICH_CONSOLE:
         _RICH_CONSOLE.print(f"\n[bold cyan]Tool: {tool_name}[/bold cyan]")
@@ -189,21 +195,10 @@ def tools(
 
         # Try to get version info
         _RICH_CONSOLE.print("\n[bold cyan]Version Information:[/bold cyan]")
-        version_info = get_tool_version(
-            tool_name,
-            use_container=is_apptainer_available(),
-            subcommand=subcommand,
-        )
         _RICH_CONSOLE.print(f"[bold white]Version: {version_info}[/bold white]")
 
-        # Get and display help
+        # Display help
         _RICH_CONSOLE.print("\n[bold cyan]Help / Usage:[/bold cyan]")
-        help_text = get_tool_help(tool_name, subcommand=subcommand)
-        if (
-            help_text.startswith("Help information not available")
-            and is_apptainer_available()
-        ):
-            help_text = run_tool_help_in_container(tool_name, subcommand=subcommand)
         _RICH_CONSOLE.print(help_text)
 
         if is_apptainer_available():
@@ -220,17 +215,6 @@ def tools(
         if subcommands:
             typer.echo(f"Subcommands: {', '.join(subcommands)}")
         typer.echo("\nVersion Information:")
-        version_info = get_tool_version(
-            tool_name,
-            use_container=is_apptainer_available(),
-            subcommand=subcommand,
-        )
         typer.echo(version_info)
         typer.echo("\nHelp / Usage:")
-        help_text = get_tool_help(tool_name, subcommand=subcommand)
-        if (
-            help_text.startswith("Help information not available")
-            and is_apptainer_available()
-        ):
-            help_text = run_tool_help_in_container(tool_name, subcommand=subcommand)
         typer.echo(help_text)
@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+import functools
 import re
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import Any, List, Optional
 
+import numpy as np
+import pandas as pd
 import typer
 from loguru import logger
+from pandas.api.types import (
+    is_bool_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+    pandas_dtype,
+)
 
 from seqnado.cli.utils import _style_name_with_rich
+from seqnado.inputs import Assay as AssayEnum
 
-if TYPE_CHECKING:
-    import pandas as pd
+
+_IGNORED_COLUMNS = frozenset({"r2", "r1_control", "r2_control", "ip", "control"})
+_RNA_ONLY_COLUMNS = frozenset({"deseq2", "group"})
 
 
 def _extract_candidate_defaults_from_schema(
@@ -23,22 +34,27 @@ def _extract_candidate_defaults_from_schema(
     - Ignores: r2, r1_control, r2_control, ip, control
     - Ignores: deseq2 for non-RNA assays
     - Considers a column a candidate if it has a schema default OR is nullable
+
+    The schema is only introspected once per (model, assay); the per-column
+    metadata dicts are shared between calls and must not be mutated.
     """
+    return dict(_build_candidates(model, assay))
+
+
+@functools.lru_cache(maxsize=None)
+def _build_candidates(model: type, assay: Any) -> dict[str, dict[str, Any]]:
     try:
         schema = model.to_schema()  # Pandera DataFrameModel -> Schema
     except Exception as e:
-        logger.debug("Could not convert model to schema: %s", e)
+        logger.debug("Could not convert model to schema: {}", e)
         return {}
 
     out: dict[str, dict[str, Any]] = {}
-    to_ignore = {"r2", "r1_control", "r2_control", "ip", "control"}
 
     # Also ignore deseq2 and group for non-RNA assays
-    from seqnado.inputs import Assay as AssayEnum
-
+    to_ignore = _IGNORED_COLUMNS
     if assay != AssayEnum.RNA:
-        to_ignore.add("deseq2")
-        to_ignore.add("group")
+        to_ignore = to_ignore | _RNA_ONLY_COLUMNS
 
     for name, col in schema.columns.items():
         if name in to_ignore:
@@ -54,8 +70,6 @@ def _extract_candidate_defaults_from_schema(
 
         categories = None
         try:
-            import pandas as pd
-
             if isinstance(dtype, pd.CategoricalDtype):
                 categories = list(dtype.categories)
             elif getattr(dtype, "categories", None) is not None:
@@ -85,15 +99,37 @@ def _format_col_hint(name: str, meta: dict[str, Any]) -> str:
     """
     name_colored = _style_name_with_rich(name)
 
-    parts: List[str] = []
-    if meta.get("description"):
-        parts.append(str(meta["description"]))
-
+    desc = meta.get("description")
+    desc = str(desc) if desc else ""
     cats = meta.get("categories")
-    if cats:
-        parts.append("choices=[" + ", ".join(map(str, cats)) + "]")
+    choices = f"choices=[{', '.join(map(str, cats))}]" if cats else ""
+
+    if desc and choices:
+        return f"{name_colored}: {desc} · {choices}"
+    if desc or choices:
+        return f"{name_colored}: {desc or choices}"
+    return name_colored
 
-    return f"{name_colored}: " + " · ".join(parts) if parts else name_colored
+
+_TRUE_STRINGS = frozenset({"true", "t", "yes", "y", "1"})
+_FALSE_STRINGS = frozenset({"false", "f", "no", "n", "0"})
+
+
+@functools.lru_cache(maxsize=64)
+def _classify_dtype(dtype: Any) -> Optional[str]:
+    """Return "bool", "int" or "float" for a schema dtype, or None to keep strings."""
+    try:
+        pd_dtype = pandas_dtype(dtype)
+    except Exception:
+        pd_dtype = dtype
+
+    if is_bool_dtype(pd_dtype):
+        return "bool"
+    if is_integer_dtype(pd_dtype):
+        return "int"
+    if is_float_dtype(pd_dtype):
+        return "float"
+    return None
 
 
 def _coerce_value_to_dtype(
@@ -103,9 +139,6 @@ def _coerce_value_to_dtype(
     Best-effort conversion from string input to the schema dtype.
     Keeps string if unsure. Enforces categorical choices if provided.
     """
-    import pandas as pd
-    from pandas.api import types as _pdt
-
     if categories is not None:
         # Allow empty/nullable
         if value == "" or value in categories:
@@ -116,28 +149,28 @@ def _coerce_value_to_dtype(
         return value
 
     try:
-        pd_dtype = pd.api.types.pandas_dtype(dtype)
-    except Exception:
-        pd_dtype = dtype
+        kind = _classify_dtype(dtype)
+    except TypeError:  # unhashable dtype object; classify without the cache
+        kind = _classify_dtype.__wrapped__(dtype)
 
     # boolean handling
-    if _pdt.is_bool_dtype(pd_dtype):
+    if kind == "bool":
         low = value.strip().lower()
-        if low in {"true", "t", "yes", "y", "1"}:
+        if low in _TRUE_STRINGS:
             return True
-        if low in {"false", "f", "no", "n", "0"}:
+        if low in _FALSE_STRINGS:
             return False
         raise ValueError("Enter a boolean (y/n, true/false, 1/0).")
 
     # integer
-    if _pdt.is_integer_dtype(pd_dtype):
+    if kind == "int":
         try:
             return int(value)
         except Exception as e:
             raise ValueError(str(e))
 
     # float
-    if _pdt.is_float_dtype(pd_dtype):
+    if kind == "float":
         try:
             return float(value)
         except Exception as e:
@@ -147,6 +180,129 @@ def _coerce_value_to_dtype(
     return value
 
 
+_SPLIT_RE = re.compile(r"[-_]")
+_REP_RE = re.compile(r"^rep\d+$")
+_BATCH_RE = re.compile(r"^batch\d+$")
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a user-supplied group pattern once per distinct string."""
+    return re.compile(pattern)
+
+
+# Common group keywords to look for, in priority order
+_GROUP_KEYWORDS = (
+    "control",
+    "ctrl",
+    "treated",
+    "treatment",
+    "treat",
+    "wt",
+    "wildtype",
+    "wild-type",
+    "ko",
+    "knockout",
+    "knock-out",
+    "mut",
+    "mutant",
+    "untreated",
+    "knockdown",
+    "kd",
+    "vehicle",
+    "mock",
+    "dmso",
+)
+_GROUP_KEYWORD_RANK = {keyword: rank for rank, keyword in enumerate(_GROUP_KEYWORDS)}
+_GROUP_KEYWORD_RE = re.compile("|".join(map(re.escape, _GROUP_KEYWORDS)))
+
+# Keywords marking the reference group (coded as 0 in the deseq2 column)
+_CONTROL_KEYWORDS = (
+    "control",
+    "ctrl",
+    "untreated",
+    "vehicle",
+    "mock",
+    "dmso",
+    "wt",
+    "wildtype",
+)
+_CONTROL_KEYWORD_RE = re.compile("|".join(map(re.escape, _CONTROL_KEYWORDS)))
+
+# Sample-name prefixes that end the walk back from a "repN" part
+_GENERIC_PREFIXES = frozenset({"test", "sample", "exp", "experiment"})
+
+
+def _extract_group(sample_id: str) -> str:
+    """Extract a group label from a single sample_id (keyword, then heuristics)."""
+    sample_lower = sample_id.lower()
+
+    # Split on both hyphens and underscores
+    parts = _SPLIT_RE.split(sample_id)
+    lower_parts = [part.lower() for part in parts]
+
+    # First, try to find exact keyword matches in the parts; the
+    # highest-priority keyword wins, then the earliest part
+    ranked = [
+        (_GROUP_KEYWORD_RANK[low], i)
+        for i, low in enumerate(lower_parts)
+        if low in _GROUP_KEYWORD_RANK
+    ]
+    if ranked:
+        return parts[min(ranked)[1]]
+
+    # If no exact match, look for keywords as substrings (one regex pass
+    # rules out samples that contain no keyword at all)
+    if _GROUP_KEYWORD_RE.search(sample_lower):
+        for keyword in _GROUP_KEYWORDS:
+            if keyword in sample_lower:
+                # Try to extract the part containing the keyword
+                for part, low in zip(parts, lower_parts):
+                    if keyword in low:
+                        return part
+
+    # Try to find the part(s) before "rep" pattern (be more specific: "rep" followed by digits)
+    for i, low in enumerate(lower_parts):
+        if _REP_RE.match(low) and i > 0:
+            # Strategy: Collect all meaningful parts between start and rep
+            # Skip batch numbers and generic prefixes like "test", "sample", "exp"
+            group_parts = []
+            found_keyword = False
+
+            for j in range(i - 1, -1, -1):
+                prev_part = parts[j]
+                prev_lower = lower_parts[j]
+
+                # Skip batch numbers - they're technical, not biological groups
+                if _BATCH_RE.match(prev_lower):
+                    continue
+
+                # Check if this is a generic prefix to stop at
+                if prev_lower in _GENERIC_PREFIXES:
+                    # We've gone too far - stop here
+                    break
+
+                # Add this part to our group
+                group_parts.insert(0, prev_part)
+
+                # Track if we found a treatment keyword
+                if _GROUP_KEYWORD_RE.search(prev_lower):
+                    found_keyword = True
+
+            # If we collected parts, join them with hyphens
+            if group_parts:
+                return "-".join(group_parts)
+            # Fallback: use the part right before rep
+            return parts[i - 1]
+
+    # Fallback: use second-to-last part if there are multiple parts
+    if len(parts) >= 2:
+        return parts[-2]
+
+    # Last resort: return the whole sample_id (will likely fail validation)
+    return sample_id
+
+
 def _extract_deseq2_groups_from_sample_names(
     sample_ids: pd.Series,
     pattern: str | None = None,
@@ -168,158 +324,84 @@ def _extract_deseq2_groups_from_sample_names(
     Returns:
         Tuple of (group_names, binary_encoding) or None if groups cannot be reliably extracted
     """
-    import pandas as pd
-
     # Strategy 1: Regex pattern matching
     if pattern:
         try:
-            groups = sample_ids.str.extract(pattern, expand=False)
-            if groups.notna().all() and groups.nunique() >= 2:
-                # Validate groups are reasonably balanced
+            groups = sample_ids.str.extract(_compile_pattern(pattern), expand=False)
+            if groups.notna().all():
+                # Validate there are 2+ reasonably balanced groups
                 group_counts = groups.value_counts()
-                if group_counts.min() > 0 and group_counts.max() / len(groups) <= 0.9:
+                if (
+                    len(group_counts) >= 2
+                    and group_counts.iat[-1] > 0
+                    and group_counts.iat[0] / len(groups) <= 0.9
+                ):
                     return (groups, None)
         except Exception:
             pass  # Fall through to other strategies
 
-    # Strategy 2 & 3: Keyword detection and heuristics
-    # Common group keywords to look for
-    group_keywords = [
-        "control",
-        "ctrl",
-        "treated",
-        "treatment",
-        "treat",
-        "wt",
-        "wildtype",
-        "wild-type",
-        "ko",
-        "knockout",
-        "knock-out",
-        "mut",
-        "mutant",
-        "untreated",
-        "knockdown",
-        "kd",
-        "vehicle",
-        "mock",
-        "dmso",
-    ]
-
-    def extract_group(sample_id: str) -> str:
-        """Extract group from a single sample_id."""
-        sample_lower = sample_id.lower()
-
-        # Split on both hyphens and underscores
-        parts = re.split(r"[-_]", sample_id)
-
-        # First, try to find exact keyword matches in the parts
-        for keyword in group_keywords:
-            for part in parts:
-                if keyword == part.lower():
-                    return part
-
-        # If no exact match, look for keywords as substrings
-        for keyword in group_keywords:
-            if keyword in sample_lower:
-                # Try to extract the part containing the keyword
-                for part in parts:
-                    if keyword in part.lower():
-                        return part
-
-        # Try to find the part(s) before "rep" pattern (be more specific: "rep" followed by digits)
-        for i, part in enumerate(parts):
-            if re.match(r"^rep\d+$", part.lower()) and i > 0:
-                # Strategy: Collect all meaningful parts between start and rep
-                # Skip batch numbers and generic prefixes like "test", "sample", "exp"
-                group_parts = []
-                found_keyword = False
-
-                for j in range(i - 1, -1, -1):
-                    prev_part = parts[j]
-                    prev_lower = prev_part.lower()
-
-                    # Skip batch numbers - they're technical, not biological groups
-                    if re.match(r"^batch\d+$", prev_lower):
-                        continue
-
-                    # Check if this is a generic prefix to stop at
-                    if prev_lower in ["test", "sample", "exp", "experiment"]:
-                        # We've gone too far - stop here
-                        break
-
-                    # Add this part to our group
-                    group_parts.insert(0, prev_part)
-
-                    # Track if we found a treatment keyword
-                    if any(keyword in prev_lower for keyword in group_keywords):
-                        found_keyword = True
-
-                # If we collected parts, join them with hyphens
-                if group_parts:
-                    return "-".join(group_parts)
-                # Fallback: use the part right before rep
-                return parts[i - 1]
-
-        # Fallback: use second-to-last part if there are multiple parts
-        if len(parts) >= 2:
-            return parts[-2]
-
-        # Last resort: return the whole sample_id (will likely fail validation)
-        return sample_id
-
-    # Extract groups for all samples
-    groups = sample_ids.apply(extract_group)
+    # Strategy 2 & 3: Keyword detection and heuristics.
+    # Extract groups for all samples. Exact keyword hits on a hyphen/underscore
+    # separated part are resolved in one vectorized pass; only the remaining
+    # rows go through _extract_group.
+    ids = pd.Series(sample_ids.to_numpy(), dtype=object)
+    parts = ids.str.split(_SPLIT_RE, regex=True).explode()
+    hits = pd.DataFrame(
+        {"part": parts, "rank": parts.str.lower().map(_GROUP_KEYWORD_RANK)}
+    ).dropna(subset=["rank"])
+    # Highest-priority keyword wins; a stable sort keeps the first part on ties
+    hits = hits.sort_values("rank", kind="stable")
+    hits = hits[~hits.index.duplicated()]
+
+    resolved = pd.Series(None, index=ids.index, dtype=object)
+    resolved.loc[hits.index] = hits["part"]
+    unresolved = resolved.isna()
+    if unresolved.any():
+        resolved.loc[unresolved] = ids[unresolved].map(_extract_group)
+    groups = pd.Series(resolved.to_numpy(), index=sample_ids.index, dtype=object)
+
+    # One counting pass; value_counts is sorted, so iat[0] is the largest group
+    group_counts = groups.value_counts()
 
     # Check if we have at least 2 distinct groups
-    unique_groups = groups.nunique()
-    if unique_groups < 2:
+    if len(group_counts) < 2:
         # Not enough groups to do differential analysis
         return None
 
     # Check if groups are reasonably balanced (no single group dominates too much)
     # This helps avoid extracting noise like replicate numbers
-    group_counts = groups.value_counts()
-    if group_counts.min() == 0 or group_counts.max() / len(groups) > 0.9:
+    if group_counts.iat[-1] == 0 or group_counts.iat[0] / len(groups) > 0.9:
         return None
 
     # Check if each "group" only has one sample (likely failed extraction)
     # This happens with samples like A1, A2, B1, B2 where each is its own "group"
-    if group_counts.max() == 1:
+    if group_counts.iat[0] == 1:
         # Every sample is in its own group - this is not useful for DESeq2
         return None
 
-    # Determine which group is the control (reference) and which is treatment
-    # Control keywords (should be coded as 0)
-    control_keywords = [
-        "control",
-        "ctrl",
-        "untreated",
-        "vehicle",
-        "mock",
-        "dmso",
-        "wt",
-        "wildtype",
-    ]
-
-    # Find which group is the control
+    # Determine which group is the control (reference) and which is treatment:
+    # the first group (in order of appearance) containing a control keyword
     unique_group_names = groups.unique()
-    control_group = None
-
-    for group_name in unique_group_names:
-        if any(keyword in str(group_name).lower() for keyword in control_keywords):
-            control_group = group_name
-            break
-
-    # If no control keyword found, use the first group alphabetically as reference
-    if control_group is None:
+    is_control = (
+        pd.Series(unique_group_names, dtype=object)
+        .astype(str)
+        .str.lower()
+        .str.contains(_CONTROL_KEYWORD_RE)
+    )
+
+    if is_control.any():
+        control_group = unique_group_names[is_control.to_numpy().argmax()]
+    else:
+        # If no control keyword found, use the first group alphabetically as reference
         control_group = sorted(unique_group_names)[0]
 
     # Only create binary encoding if there are exactly 2 groups
     # For 3+ groups, DESeq2 requires more complex contrasts that should be manually specified
     if len(unique_group_names) == 2:
         # Create binary encoding: 0 for control, 1 for treatment
-        deseq2_binary = groups.apply(lambda x: 0 if x == control_group else 1)
+        deseq2_binary = pd.Series(
+            (groups.to_numpy() != control_group).astype(int), index=groups.index
+        )
     else:
         # For 3+ groups, return None for deseq2 - user must manually configure
         logger.warning(
@@ -334,6 +416,35 @@ def _extract_deseq2_groups_from_sample_names(
     return (groups, deseq2_binary)
 
 
+def _constant_column(
+    value: Any, length: int, categories: Optional[List[Any]], dtype: Any
+) -> Any:
+    """
+    Return a column value filling `length` rows with `value`.
+
+    Categorical choices are built straight from integer codes, skipping the
+    object-array round trip and category uniqueness check; anything else is
+    returned as a scalar for pandas to broadcast.
+    """
+    if categories is None or value not in categories:
+        return value
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        cat_dtype = dtype
+    else:
+        cat_dtype = pd.CategoricalDtype(categories)
+    n_categories = len(cat_dtype.categories)
+    codes = np.full(
+        length,
+        cat_dtype.categories.get_loc(value),
+        dtype=np.int8 if n_categories < 128 else np.int32,
+    )
+    try:
+        return pd.Categorical.from_codes(codes, dtype=cat_dtype, validate=False)
+    except TypeError:  # pandas < 2.1 has no `validate`
+        return pd.Categorical.from_codes(codes, dtype=cat_dtype)
+
+
 def _apply_interactive_defaults(
     df_in: pd.DataFrame,
     candidates: dict[str, dict[str, Any]],
@@ -345,21 +456,22 @@ def _apply_interactive_defaults(
     """
     For any candidate column not present in df_in, optionally add it.
 
-    - Returns a new DataFrame (does not mutate the input).
+    - Never mutates the input; returns it unchanged when no column is missing,
+      otherwise a copy with the added columns.
     - If `accept_all_defaults` is True, auto-add only when a schema default exists.
     - If `interactive` is False, do nothing (safe for CI/batch).
     """
-    import pandas as pd
+    present = set(df_in.columns)
+    missing = [c for c in candidates if c not in present]
+    if not missing:
+        return df_in
 
     df = df_in.copy()
-    missing = [c for c in candidates.keys() if c not in df.columns]
-    if not missing:
-        return df
 
     for col in missing:
         # Skip if column was already populated during this loop
         # (e.g., both group and deseq2 populated when handling group)
-        if col in df.columns:
+        if col in present:
             continue
 
         meta = candidates[col]
@@ -377,8 +489,6 @@ def _apply_interactive_defaults(
             and "sample_id" in df.columns
             and assay is not None
         ):
-            from seqnado.inputs import Assay as AssayEnum
-
             if assay == AssayEnum.RNA:
                 result = _extract_deseq2_groups_from_sample_names(
                     df["sample_id"], pattern=deseq2_pattern
@@ -397,14 +507,12 @@ def _apply_interactive_defaults(
                         logger.info(
                             f"Adding 'group' column with {len(set(groups))} groups: {sorted(set(groups))}"
                         )
+                    present.update(("group", "deseq2"))
                     continue
 
         if accept_all_defaults and default is not None:
             logger.info(f"Adding '{col}' with schema default={default!r}  ({hint})")
-            try:
-                df[col] = pd.Series([default] * len(df), index=df.index)
-            except Exception:
-                df[col] = default
+            df[col] = _constant_column(default, len(df), categories, dtype)
             continue
         elif accept_all_defaults:
             continue
@@ -420,8 +528,6 @@ def _apply_interactive_defaults(
             and "sample_id" in df.columns
             and assay is not None
         ):
-            from seqnado.inputs import Assay as AssayEnum
-
             if assay == AssayEnum.RNA:
                 extracted_result = _extract_deseq2_groups_from_sample_names(
                     df["sample_id"], pattern=deseq2_pattern
@@ -442,6 +548,7 @@ def _apply_interactive_defaults(
                             logger.info(
                                 f"Added 'group' and 'deseq2' columns with auto-detected groups: {unique_groups}"
                             )
+                            present.update(("group", "deseq2"))
                             continue
                     else:
                         # 3+ groups - offer uniform value or use detected groups
@@ -463,6 +570,7 @@ def _apply_interactive_defaults(
                             logger.info(
                                 f"Added 'group' column with {len(unique_groups)} groups"
                             )
+                            present.update(("group", "deseq2"))
                             continue
                         else:
                             # Fall through to let user specify uniform value
@@ -474,10 +582,7 @@ def _apply_interactive_defaults(
                 default=True,
             )
             if add_col:
-                try:
-                    df[col] = pd.Series([default] * len(df), index=df.index)
-                except Exception:
-                    df[col] = default
+                df[col] = _constant_column(default, len(df), categories, dtype)
         else:
             add_col = typer.confirm(
                 f"⚠️ Optional column '{col}' is missing.\n{hint}\nAdd it with a uniform value or enter 'n' to skip?",
@@ -491,14 +596,11 @@ def _apply_interactive_defaults(
                         default="",
                     )
                     if raw == "" and nullable:
-                        df[col] = pd.Series([pd.NA] * len(df), index=df.index)
+                        df[col] = pd.Series(pd.NA, index=df.index, dtype=object)
                         break
                     try:
                         coerced = _coerce_value_to_dtype(raw, dtype, categories)
-                        try:
-                            df[col] = pd.Series([coerced] * len(df), index=df.index)
-                        except Exception:
-                            df[col] = coerced
+                        df[col] = _constant_column(coerced, len(df), categories, dtype)
                         break
                     except ValueError as e:
                         typer.echo(f"[invalid] {e}")
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
+import os
+import shlex
 import shutil
 from pathlib import Path
 from typing import List, Optional
@@ -10,6 +14,37 @@ from loguru import logger
 
 from seqnado.utils import get_preset_profiles, resolve_profile_path
 
+_CONTAINER_RUNTIMES = ("apptainer", "singularity")
+_CONTAINER_FLAGS = {
+    "apptainer": ("--use-apptainer", "Using Apptainer for container support"),
+    "singularity": ("--use-singularity", "Using Singularity for container support"),
+}
+
+
+@functools.cache
+def _detect_container_runtime() -> Optional[str]:
+    """
+    Return the available container runtime ("apptainer", "singularity") or None.
+
+    Honors SEQNADO_CONTAINER_RUNTIME (apptainer/singularity/none) to skip
+    the PATH probe; otherwise the first runtime found on PATH wins. The
+    result is cached for the lifetime of the process.
+    """
+    override = os.environ.get("SEQNADO_CONTAINER_RUNTIME", "").strip().lower()
+    if override in _CONTAINER_RUNTIMES:
+        return override
+    if override == "none":
+        return None
+    if override:
+        logger.warning(
+            f"Ignoring unknown SEQNADO_CONTAINER_RUNTIME={override!r}; "
+            f"expected one of {', '.join(_CONTAINER_RUNTIMES)} or 'none'"
+        )
+    for runtime in _CONTAINER_RUNTIMES:
+        if shutil.which(runtime):
+            return runtime
+    return None
+
 
 class SnakemakeCommandBuilder:
     """
@@ -57,8 +92,8 @@ class SnakemakeCommandBuilder:
         Example:
             builder.add_config(genome="hg38", output_dir="/tmp")
         """
-        config_parts = [f"{k}={v}" for k, v in kwargs.items()]
-        self.cmd.extend(["--config"] + config_parts)
+        self.cmd.append("--config")
+        self.cmd.extend(f"{k}={v}" for k, v in kwargs.items())
         return self
 
     def add_profile_from_path(self, profile_path: Path | str) -> SnakemakeCommandBuilder:
@@ -114,20 +149,19 @@ class SnakemakeCommandBuilder:
 
     def add_show_failed_logs(self) -> SnakemakeCommandBuilder:
         """Add --show-failed-logs flag. Returns self for chaining."""
-        if "--show-failed-logs" not in self.cmd:
-            self.cmd.append("--show-failed-logs")
+        # Always present: __init__ seeds the command with --show-failed-logs,
+        # so there is nothing to append (and no need to scan self.cmd).
         return self
 
     def add_container_support(self) -> SnakemakeCommandBuilder:
         """
         Add container support (apptainer or singularity). Returns self for chaining.
         """
-        if shutil.which("apptainer"):
-            self.cmd.append("--use-apptainer")
-            logger.info("Using Apptainer for container support")
-        elif shutil.which("singularity"):
-            self.cmd.append("--use-singularity")
-            logger.info("Using Singularity for container support")
+        runtime = _detect_container_runtime()
+        if runtime:
+            flag, message = _CONTAINER_FLAGS[runtime]
+            self.cmd.append(flag)
+            logger.info(message)
         else:
             logger.warning(
                 "No container runtime (apptainer/singularity) found. "
@@ -197,8 +231,8 @@ class SnakemakeCommandBuilder:
             self for method chaining
         """
         if kwargs:
-            resource_parts = [f"{k}={v}" for k, v in kwargs.items()]
-            self.cmd.extend(["--default-resources"] + resource_parts)
+            self.cmd.append("--default-resources")
+            self.cmd.extend(f"{k}={v}" for k, v in kwargs.items())
         return self
 
     def add_queue(self, queue: str, preset: str) -> SnakemakeCommandBuilder:
@@ -213,7 +247,8 @@ class SnakemakeCommandBuilder:
             self for method chaining
         """
         if queue and preset and preset.startswith("s"):
-            self.cmd.extend(["--default-resources", f"slurm_partition={queue}"])
+            self.cmd.append("--default-resources")
+            self.cmd.append(f"slurm_partition={queue}")
         return self
 
     def add_workflow_args(self, workflow_args: List[str]) -> SnakemakeCommandBuilder:
@@ -221,13 +256,14 @@ class SnakemakeCommandBuilder:
         Add workflow_args config for nested Snakemake runs (multiomics mode). Returns self for chaining.
         
         Args:
-            workflow_args: List of arguments to pass to nested Snakemake runs
+            workflow_args: Pre-split argv tokens to pass to nested Snakemake runs;
+                they are shell-quoted into the single config value here
         
         Returns:
             self for method chaining
         """
         if workflow_args:
-            workflow_args_str = " ".join(workflow_args)
+            workflow_args_str = shlex.join(workflow_args)
             self.cmd.extend(["--config", f"workflow_args={workflow_args_str}"])
         return self
 
@@ -236,5 +272,5 @@ class SnakemakeCommandBuilder:
         return self.cmd + self.targets
 
     def build_str(self) -> str:
-        """Return the complete command as a shell command string."""
-        return " ".join(self.cmd + self.targets)
+        """Return the complete command as a shell-quoted command string."""
+        return shlex.join(itertools.chain(self.cmd, self.targets))
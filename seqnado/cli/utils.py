@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import json
 import os
+import pkgutil
+import shlex
 import subprocess
 import sys
 import tempfile
@@ -18,6 +21,12 @@ from loguru import logger
 
 from seqnado.utils import get_preset_profiles, resolve_profile_path
 
+# orjson is optional; it only speeds up parsing the JSON config files
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 # Rich console capture may or may not be available — keep an opt-in safe reference
 try:
     from rich.console import Console  # type: ignore
@@ -61,8 +70,36 @@ def _pkg_traversable(pkg: str):
     return resources.files(pkg)
 
 
+def _read_packaged_bytes(pkg: str, name: str) -> bytes:
+    """Return the raw bytes of a file shipped inside a package."""
+    data = pkgutil.get_data(pkg, name)
+    if data is None:  # loader without get_data support
+        data = resources.files(pkg).joinpath(name).read_bytes()
+    return data
+
+
+@functools.lru_cache(maxsize=8)
+def _scan_assay_configs(directory: str, mtime_ns: int) -> dict:
+    """Glob a directory for assay configs; `mtime_ns` only keys the cache."""
+    from seqnado.outputs.multiomics import find_assay_config_paths
+
+    return find_assay_config_paths(Path(directory))
+
+
+def _cached_assay_configs(directory: Path) -> dict:
+    """
+    Return the assay config paths in `directory`, rescanning only when its
+    mtime changes (adding or removing a config file bumps it).
+    """
+    resolved = Path(directory).resolve()
+    found = _scan_assay_configs(str(resolved), resolved.stat().st_mtime_ns)
+    return dict(found)
+
+
 def _read_json(path: Path) -> dict:
     """Read and parse JSON file."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     return json.loads(path.read_text(encoding="utf-8"))
 
 
@@ -96,14 +133,19 @@ def update_genome_config(config_file: Path, genome_name: str, genome_entry: dict
 
 
 def _write_json(path: Path, data: dict) -> None:
+    """Atomically write `data` to `path` as indented JSON."""
+    _write_bytes(path, json.dumps(data, indent=4).encode("utf-8"))
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
     """
-    Atomically write JSON to `path` using a temporary file + os.replace.
+    Atomically write bytes to `path` using a temporary file + os.replace.
     Attempt to set secure permissions but ignore if not supported.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = Path(tempfile.mktemp(dir=str(path.parent)))
     try:
-        tmp.write_text(json.dumps(data, indent=4), encoding="utf-8")
+        tmp.write_bytes(data)
         os.replace(str(tmp), str(path))
         try:
             os.chmod(path, 0o600)
@@ -119,6 +161,12 @@ def _write_json(path: Path, data: dict) -> None:
                 pass
 
 
+def _write_csv(df: "pandas.DataFrame", path: Path) -> None:
+    """Write a design DataFrame to CSV through a single large write buffer."""
+    with open(path, "w", encoding="utf-8", newline="", buffering=1 << 20) as fh:
+        df.to_csv(fh, index=False, lineterminator="\n")
+
+
 def _snakemake_available() -> bool:
     """Check if snakemake is available on PATH."""
     import shutil
@@ -415,26 +463,25 @@ def execute_snakemake(
         print_cmd: Whether to log the command before execution
     
     Returns:
-        Exit code from subprocess.run()
+        Exit code of the snakemake process
+
+    Snakemake inherits this process's stdout/stderr, so its output goes
+    straight to the terminal rather than through a pipe.
     """
     os.chdir(cwd)
     os.environ["PWD"] = cwd
     
     if print_cmd:
-        logger.info("Snakemake command:\n$ " + " ".join(map(str, cmd)))
+        logger.info("Snakemake command:\n$ " + shlex.join(map(str, cmd)))
     
-    completed = subprocess.run(cmd, cwd=cwd)
-    return completed.returncode
+    proc = subprocess.Popen(cmd, cwd=cwd)
+    return proc.wait()
 
 
 def print_logo(pkg_root_trav) -> None:
     """Print the SeqNado ASCII logo if available."""
     logo_trav = pkg_root_trav.joinpath("data").joinpath("logo.txt")
     try:
-        with resources.as_file(logo_trav) as lp:
-            try:
-                print(Path(lp).read_text())
-            except Exception:
-                pass
+        print(logo_trav.read_text())
     except Exception:
         pass
@@ -14,11 +14,14 @@ from seqnado.tools.tools import (
     get_tool_info,
     get_tool_subcommands,
     get_tool_version,
+    get_tool_version_and_help,
     get_tool_version_from_container,
     is_apptainer_available,
+    iter_tool_help_in_container,
     list_tools,
     run_command_in_container,
     run_tool_help_in_container,
+    run_tool_meta_in_container,
     tool_exists,
 )
 
@@ -36,10 +39,13 @@ __all__ = [
     "get_tool_info",
     "get_tool_subcommands",
     "get_tool_version",
+    "get_tool_version_and_help",
     "get_tool_version_from_container",
     "is_apptainer_available",
+    "iter_tool_help_in_container",
     "list_tools",
     "run_command_in_container",
     "run_tool_help_in_container",
+    "run_tool_meta_in_container",
     "tool_exists",
 ]
@@ -7,13 +7,15 @@ available in the SeqNado pipeline container.
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
+import shlex
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from loguru import logger
 
@@ -134,34 +136,57 @@ def get_available_tools() -> Dict[str, Dict[str, Any]]:
     return AVAILABLE_TOOLS
 
 
-def list_tools(category: Optional[str] = None) -> List[tuple]:
-    """
-    List available tools, optionally filtered by category.
+# Module-level cache: (registry it was built from, {category_lower | None: sorted rows})
+_tools_by_category: Optional[
+    Tuple[Dict[str, Dict[str, Any]], Dict[Optional[str], List[tuple]]]
+] = None
 
-    Args:
-        category: Optional category to filter tools by
 
-    Returns:
-        List of tuples (tool_name, description, category)
-    """
+def _build_category_index() -> Dict[Optional[str], List[tuple]]:
+    """Return sorted tool rows for every category (key None = all tools)."""
+    global _tools_by_category
+    if _tools_by_category is not None and _tools_by_category[0] is AVAILABLE_TOOLS:
+        return _tools_by_category[1]
+
     # Get categories in preferred order
     all_categories = get_categories()
     category_order = {cat: i for i, cat in enumerate(all_categories)}
 
-    tools = []
-
+    index: Dict[Optional[str], List[tuple]] = {None: []}
     for tool_name, tool_info in AVAILABLE_TOOLS.items():
         cat = tool_info["category"]
         # Handle both single string and list of categories
         cats = cat if isinstance(cat, list) else [cat]
-
-        if category is None or category.lower() in [c.lower() for c in cats]:
-            # For display, use first category or all if multiple
-            display_cat = cats[0] if cats else "Unknown"
-            tools.append((tool_name, tool_info["description"], display_cat))
+        # For display, use first category or all if multiple
+        display_cat = cats[0] if cats else "Unknown"
+        row = (tool_name, tool_info["description"], display_cat)
+        index[None].append(row)
+        for c in {c.lower() for c in cats}:
+            index.setdefault(c, []).append(row)
 
     # Sort by category order, then by tool name
-    return sorted(tools, key=lambda x: (category_order.get(x[2], 999), x[0]))
+    for rows in index.values():
+        rows.sort(key=lambda x: (category_order.get(x[2], 999), x[0]))
+
+    _tools_by_category = (AVAILABLE_TOOLS, index)
+    return index
+
+
+def list_tools(category: Optional[str] = None) -> List[tuple]:
+    """
+    List available tools, optionally filtered by category.
+
+    The per-category lists are built in one pass over the registry and reused
+    until AVAILABLE_TOOLS is replaced.
+
+    Args:
+        category: Optional category to filter tools by
+
+    Returns:
+        List of tuples (tool_name, description, category)
+    """
+    key = category.lower() if category is not None else None
+    return list(_build_category_index().get(key, ()))
 
 
 def get_categories() -> List[str]:
@@ -376,27 +401,31 @@ def get_tool_help(
         return f"Error retrieving help for '{tool_name}': {str(e)}"
 
 
-def _get_bibtex_entry(citation_key: str) -> Optional[str]:
-    """Extract a raw BibTeX entry from the citations file by key."""
+_BIBTEX_ENTRY_RE = re.compile(r"^(@\w+\{([^,\s]+),.*?^})", re.MULTILINE | re.DOTALL)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_bibtex_entries() -> Dict[str, str]:
+    """Index the packaged citations file by key, once per process."""
     bib_path = Path(__file__).parent.joinpath("tool_citations.bib")
     if not bib_path.exists():
-        return None
+        return {}
 
     try:
         content = bib_path.read_text()
     except Exception as e:
         logger.debug(f"Failed to read citations file: {e}")
-        return None
+        return {}
 
-    pattern = re.compile(
-        rf"^(@\w+\{{{re.escape(citation_key)},.*?^}})",
-        re.MULTILINE | re.DOTALL,
-    )
-    match = pattern.search(content)
-    if match:
-        return match.group(1)
+    entries: Dict[str, str] = {}
+    for match in _BIBTEX_ENTRY_RE.finditer(content):
+        entries.setdefault(match.group(2), match.group(1))
+    return entries
 
-    return None
+
+def _get_bibtex_entry(citation_key: str) -> Optional[str]:
+    """Extract a raw BibTeX entry from the citations file by key."""
+    return _load_bibtex_entries().get(citation_key)
 
 
 def format_citation(bibtex: str) -> Optional[str]:
@@ -506,13 +535,12 @@ def get_seqnado_container_uri() -> Optional[str]:
 
 def is_apptainer_available() -> bool:
     """Check if apptainer is available on the system."""
-    return (
-        shutil.which("apptainer") is not None or shutil.which("singularity") is not None
-    )
+    return get_apptainer_command() is not None
 
 
+@functools.lru_cache(maxsize=1)
 def get_apptainer_command() -> Optional[str]:
-    """Get the apptainer/singularity command to use."""
+    """Get the apptainer/singularity command to use (PATH is searched once per process)."""
     if shutil.which("apptainer"):
         return "apptainer"
     elif shutil.which("singularity"):
@@ -541,6 +569,16 @@ def run_command_in_container(
     if not tool_info:
         return 1, "", f"Tool '{tool_name}' not found"
 
+    command = _resolve_tool_command(tool_info, subcommand)
+    return _exec_in_container(tool_info, [command] + args, container_uri)
+
+
+def _container_command(
+    tool_info: Dict[str, Any],
+    argv: List[str],
+    container_uri: Optional[str] = None,
+) -> Tuple[Optional[List[str]], str]:
+    """Build the apptainer/singularity exec command for `argv`, or (None, error)."""
     # Use provided container URI, or get from tool info, or fall back to default
     if container_uri is None:
         container_uri = tool_info.get("container")
@@ -549,18 +587,26 @@ def run_command_in_container(
         container_uri = get_seqnado_container_uri()
 
     if not container_uri:
-        return 1, "", "Could not determine container URI"
+        return None, "Could not determine container URI"
 
     apptainer_cmd = get_apptainer_command()
     if not apptainer_cmd:
-        return 1, "", "Apptainer/Singularity not available on system"
+        return None, "Apptainer/Singularity not available on system"
 
-    command = _resolve_tool_command(tool_info, subcommand)
+    return [apptainer_cmd, "exec", container_uri] + argv, ""
 
-    env = os.environ.copy()
 
-    # Build the command to run in container
-    cmd = [apptainer_cmd, "exec", container_uri, command] + args
+def _exec_in_container(
+    tool_info: Dict[str, Any],
+    argv: List[str],
+    container_uri: Optional[str] = None,
+) -> Tuple[int, str, str]:
+    """Run `argv` inside the tool's container and return (return_code, stdout, stderr)."""
+    cmd, error = _container_command(tool_info, argv, container_uri)
+    if cmd is None:
+        return 1, "", error
+
+    env = os.environ.copy()
 
     try:
         result = subprocess.run(
@@ -577,6 +623,17 @@ def run_command_in_container(
         return 1, "", f"Error running command: {str(e)}"
 
 
+def _accepted_help_lines(returncode: int, stdout: str, stderr: str) -> List[str]:
+    """Help output lines without Apptainer INFO noise, or [] if the run failed."""
+    # Combine stdout and stderr
+    output = (stdout + stderr).strip()
+    if not output or returncode not in (0, 1):  # Some tools return 1 for help
+        return []
+    lines = split_output_lines(output)
+    filtered = filter_apptainer_info(lines)
+    return filtered if filtered else lines
+
+
 def run_tool_help_in_container(
     tool_name: str,
     container_uri: Optional[str] = None,
@@ -610,12 +667,9 @@ def run_tool_help_in_container(
             subcommand=subcommand,
         )
 
-        # Combine stdout and stderr
-        output = (stdout + stderr).strip()
-        if output and returncode in [0, 1]:  # Some tools return 1 for help
-            lines = split_output_lines(output)
-            filtered = filter_apptainer_info(lines)
-            return "\n".join(filtered if filtered else lines)
+        lines = _accepted_help_lines(returncode, stdout, stderr)
+        if lines:
+            return "\n".join(lines)
 
     subcommands = _get_tool_subcommands(tool_info)
     if subcommands and not subcommand:
@@ -625,3 +679,137 @@ def run_tool_help_in_container(
         )
 
     return f"Help information not available for '{_resolve_tool_command(tool_info, subcommand)}'"
+
+
+def iter_tool_help_in_container(
+    tool_name: str,
+    container_uri: Optional[str] = None,
+    subcommand: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Yield a tool's ``--help`` output from the container line by line, with
+    Apptainer INFO lines removed.
+
+    The output is only accepted once the command has exited with 0 or 1, so
+    container errors (e.g. a FATAL image pull) are never shown as help; in
+    that case, or when ``--help`` prints nothing, this falls back to
+    :func:`run_tool_help_in_container`, which also tries ``-h``.
+
+    Args:
+        tool_name: Name of the tool
+        container_uri: Container URI (defaults to tool-specific container from tools.json)
+        subcommand: Optional subcommand
+
+    Yields:
+        Help output lines without trailing newlines
+    """
+    tool_info = get_tool_info(tool_name)
+    if not tool_info:
+        yield f"Tool '{tool_name}' not found"
+        return
+
+    command = _resolve_tool_command(tool_info, subcommand)
+    lines = _accepted_help_lines(
+        *_exec_in_container(tool_info, [command, "--help"], container_uri)
+    )
+    if lines:
+        yield from lines
+        return
+
+    yield run_tool_help_in_container(
+        tool_name, container_uri=container_uri, subcommand=subcommand
+    )
+
+
+_META_SEPARATOR = "---SEQNADO-META-SEP---"
+
+
+def run_tool_meta_in_container(
+    tool_name: str,
+    container_uri: Optional[str] = None,
+    subcommand: Optional[str] = None,
+) -> Dict[str, Optional[str]]:
+    """
+    Get a tool's version and help output from a single container start.
+
+    Runs ``<cmd> --version`` and ``<cmd> --help`` in one ``sh -c`` so the
+    container is only started once, then splits the combined output.
+
+    Args:
+        tool_name: Name of the tool
+        container_uri: Container URI (defaults to tool-specific container from tools.json)
+        subcommand: Optional subcommand
+
+    Returns:
+        Dict with "version" and "help" keys; a value is None when the tool
+        printed nothing usable for it.
+    """
+    meta: Dict[str, Optional[str]] = {"version": None, "help": None}
+    tool_info = get_tool_info(tool_name)
+    if not tool_info:
+        return meta
+
+    command = shlex.quote(_resolve_tool_command(tool_info, subcommand))
+    script = f"{command} --version 2>&1; echo {_META_SEPARATOR}; {command} --help 2>&1"
+    _, stdout, stderr = _exec_in_container(
+        tool_info, ["sh", "-c", script], container_uri
+    )
+    version_output, sep, help_output = (stdout + stderr).partition(_META_SEPARATOR)
+    if not sep:
+        return meta
+
+    if version_output.strip():
+        meta["version"] = extract_version_number(version_output.strip())
+    lines = split_output_lines(help_output.strip())
+    filtered = filter_apptainer_info(lines)
+    if filtered:
+        meta["help"] = "\n".join(filtered)
+    return meta
+
+
+def get_tool_version_and_help(
+    tool_name: str,
+    use_container: bool = False,
+    subcommand: Optional[str] = None,
+) -> Tuple[str, str]:
+    """
+    Get version and help text for a tool, starting its container at most once
+    when both have to come from it.
+
+    Help is tried locally first and version from container metadata first,
+    as :func:`get_tool_help` and :func:`get_tool_version` do; whatever is
+    still missing is then fetched with :func:`run_tool_meta_in_container`.
+
+    Args:
+        tool_name: Name of the tool
+        use_container: Whether the container may be used
+        subcommand: Optional subcommand
+
+    Returns:
+        Tuple of (version, help_text)
+    """
+    help_text = get_tool_help(tool_name, subcommand=subcommand)
+    if not use_container:
+        return get_tool_version(tool_name, subcommand=subcommand), help_text
+
+    tool_info = get_tool_info(tool_name)
+    if not tool_info:
+        return f"Tool '{tool_name}' not found", help_text
+
+    version = get_tool_version_from_container(tool_name)
+    need_help = help_text.startswith("Help information not available")
+
+    container_uri = tool_info.get("container")
+    runs_from_environment = not container_uri or container_uri == "Environment"
+    if not runs_from_environment and (not version or need_help):
+        meta = run_tool_meta_in_container(tool_name, subcommand=subcommand)
+        version = version or meta["version"]
+        if need_help and meta["help"]:
+            help_text = meta["help"]
+            need_help = False
+
+    if not version:
+        version = get_tool_version(tool_name, use_container=True, subcommand=subcommand)
+    if need_help:
+        help_text = run_tool_help_in_container(tool_name, subcommand=subcommand)
+    return version, help_text
@@ -1,4 +1,5 @@
 """Utility functions for SeqNado CLI and general operations."""
+import functools
 import hashlib
 import os
 import re
@@ -344,13 +345,9 @@ def get_profile_name(fn: Path) -> Optional[str]:
     return initials
 
 
-def get_preset_profiles() -> Dict[str, str]:
-    """
-    Discover and map all available Snakemake profile presets.
-    
-    Returns:
-        Dict mapping shortcode (e.g., "lc") to profile directory name
-    """
+@functools.lru_cache(maxsize=1)
+def _scan_preset_profiles() -> Tuple[Tuple[str, str], ...]:
+    """Scan the bundled profiles directory once per process."""
     from importlib import resources
     
     profiles_trav = resources.files("seqnado.workflow.envs.profiles")
@@ -362,11 +359,24 @@ def get_preset_profiles() -> Dict[str, str]:
 
     # Map profile shortcuts to directory names
     # E.g., "profile_local_conda" -> "lc", "profile_slurm_singularity" -> "ss"
-    return {
-        get_profile_name(Path(p)): p 
+    return tuple(
+        (get_profile_name(Path(p)), p)
         for p in profiles 
         if p.startswith("profile_") and get_profile_name(Path(p))
-    }
+    )
+
+
+def get_preset_profiles() -> Dict[str, str]:
+    """
+    Discover and map all available Snakemake profile presets.
+    
+    The bundled profiles directory is scanned once and cached; each call
+    returns a fresh dict so callers may mutate it freely.
+    
+    Returns:
+        Dict mapping shortcode (e.g., "lc") to profile directory name
+    """
+    return dict(_scan_preset_profiles())
 
 
 def resolve_profile_path(
@@ -76,3 +76,97 @@ def test_cli_design_includes_default_columns(tmp_path: Path):
     # Check that scaling_group column is present with default value
     assert "scaling_group" in df.columns, "scaling_group column should be present"
     assert all(df["scaling_group"] == "default"), "scaling_group should have default value 'default'"
+
+
+def test_cli_design_multiomics_scans_assay_subdirectories(tmp_path: Path):
+    """Test that multiomics mode writes one design per assay folder with FASTQs."""
+    rna_dir = tmp_path / "fastqs" / "rna"
+    atac_dir = tmp_path / "fastqs" / "atac"
+    rna_dir.mkdir(parents=True)
+    atac_dir.mkdir(parents=True)
+    (tmp_path / "fastqs" / "not_an_assay").mkdir()
+    _write_fastq(rna_dir, "rna-sample_R1.fastq.gz")
+    _write_fastq(rna_dir, "rna-sample_R2.fastq.gz")
+    _write_fastq(rna_dir, "notes.txt")
+
+    result = subprocess.run(
+        ["seqnado", "design", "--no-interactive", "--accept-all-defaults"],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, f"stderr:\n{result.stderr}\nstdout:\n{result.stdout}"
+    assert (tmp_path / "metadata_rna.csv").exists()
+    assert not (tmp_path / "metadata_atac.csv").exists()
+    df = pd.read_csv(tmp_path / "metadata_rna.csv")
+    assert len(df) == 1
+
+
+def test_cli_design_group_by_regex(tmp_path: Path):
+    """Test that --group-by extracts the first capture group into consensus_group."""
+    files = [
+        _write_fastq(tmp_path, f"{cond}-rep{rep}_R{read}.fastq.gz")
+        for cond in ("ctl", "trt")
+        for rep in (1, 2)
+        for read in (1, 2)
+    ]
+
+    result = subprocess.run(
+        [
+            "seqnado",
+            "design",
+            "rna",
+            "--no-interactive",
+            "--accept-all-defaults",
+            "--group-by",
+            r"^(\w+)-rep",
+            "-o",
+            "metadata.csv",
+            *map(str, files),
+        ],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, f"stderr:\n{result.stderr}\nstdout:\n{result.stdout}"
+    df = pd.read_csv(tmp_path / "metadata.csv")
+    assert dict(zip(df["sample_id"], df["consensus_group"])) == {
+        "ctl-rep1": "ctl",
+        "ctl-rep2": "ctl",
+        "trt-rep1": "trt",
+        "trt-rep2": "trt",
+    }
+
+
+def test_cli_design_group_by_regex_matches_ip_for_chip(tmp_path: Path):
+    """Test that for ChIP the --group-by regex sees sample_id followed by ip."""
+    files = [
+        _write_fastq(tmp_path, f"cond{rep}_{ip}_R{read}.fastq.gz")
+        for rep in (1, 2)
+        for ip in ("H3K27ac", "input")
+        for read in (1, 2)
+    ]
+
+    result = subprocess.run(
+        [
+            "seqnado",
+            "design",
+            "chip",
+            "--no-interactive",
+            "--accept-all-defaults",
+            "--group-by",
+            r"^cond\d(H3K\w+)$",
+            "-o",
+            "metadata.csv",
+            *map(str, files),
+        ],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, f"stderr:\n{result.stderr}\nstdout:\n{result.stdout}"
+    df = pd.read_csv(tmp_path / "metadata.csv")
+    assert set(df["consensus_group"]) == {"H3K27ac"}
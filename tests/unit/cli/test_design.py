@@ -0,0 +1,20 @@
+"""Tests for design CLI helpers."""
+
+import pytest
+import typer
+
+from seqnado.cli.commands.design import _parse_ip_to_control_pairings
+
+
+def test_parse_ip_to_control_pairings_strips_whitespace() -> None:
+    result = _parse_ip_to_control_pairings("H3K27ac:input, CTCF : IgG")
+
+    assert result == {"H3K27ac": "input", "CTCF": "IgG"}
+
+
+@pytest.mark.parametrize("pairing", ["H3K27ac", "H3K27ac:input:extra", "a:b,c"])
+def test_parse_ip_to_control_pairings_rejects_malformed_pairs(pairing: str) -> None:
+    with pytest.raises(typer.Exit) as excinfo:
+        _parse_ip_to_control_pairings(pairing)
+
+    assert excinfo.value.exit_code == 2
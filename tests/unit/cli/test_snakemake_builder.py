@@ -2,7 +2,10 @@
 
 import pytest
 from pathlib import Path
-from seqnado.cli.snakemake_builder import SnakemakeCommandBuilder
+from seqnado.cli.snakemake_builder import (
+    SnakemakeCommandBuilder,
+    _detect_container_runtime,
+)
 
 
 class TestSnakemakeCommandBuilder:
@@ -86,5 +89,64 @@ class TestSnakemakeCommandBuilder:
         assert "snakemake" in cmd
         assert "--dry-run" in cmd
 
+    def test_builder_add_workflow_args_quotes_tokens(self, tmp_path):
+        """Test that pre-split workflow args are joined into one quoted config value."""
+        snakefile = tmp_path / "Snakefile"
+        snakefile.touch()
+
+        cmd = (
+            SnakemakeCommandBuilder(snakefile)
+            .add_workflow_args(["--profile", "/path with space", "--printshellcmds"])
+            .build()
+        )
+
+        assert "workflow_args=--profile '/path with space' --printshellcmds" in cmd
+
+    def test_builder_show_failed_logs_not_duplicated(self, tmp_path):
+        """Test that --show-failed-logs appears exactly once."""
+        snakefile = tmp_path / "Snakefile"
+        snakefile.touch()
+
+        cmd = SnakemakeCommandBuilder(snakefile).add_show_failed_logs().build()
+
+        assert cmd.count("--show-failed-logs") == 1
+
+    def test_builder_build_str_quotes_arguments(self, tmp_path):
+        """Test that build_str shell-quotes arguments and appends targets last."""
+        snakefile = tmp_path / "Snakefile"
+        snakefile.touch()
+
+        cmd_str = (
+            SnakemakeCommandBuilder(snakefile)
+            .add_target("all")
+            .add_directory("/path with space")
+            .build_str()
+        )
+
+        assert cmd_str.endswith("--directory '/path with space' all")
+
+    @pytest.mark.parametrize(
+        "override, flag",
+        [("apptainer", "--use-apptainer"), ("singularity", "--use-singularity")],
+    )
+    def test_builder_container_runtime_env_override(
+        self, tmp_path, monkeypatch, override, flag
+    ):
+        """Test that SEQNADO_CONTAINER_RUNTIME selects the runtime without probing PATH."""
+        snakefile = tmp_path / "Snakefile"
+        snakefile.touch()
+        monkeypatch.setenv("SEQNADO_CONTAINER_RUNTIME", override)
+        monkeypatch.setattr(
+            "seqnado.cli.snakemake_builder.shutil.which",
+            lambda name: pytest.fail("PATH should not be probed"),
+        )
+        _detect_container_runtime.cache_clear()
+        try:
+            cmd = SnakemakeCommandBuilder(snakefile).add_container_support().build()
+        finally:
+            _detect_container_runtime.cache_clear()
+
+        assert flag in cmd
+
 
 # TODO: Add tests for profile resolution and pass-through args
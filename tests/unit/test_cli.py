@@ -1,10 +1,13 @@
 """Tests for CLI helper functions."""
 
 import json
+import os
 from pathlib import Path
 import shutil
 import subprocess
 
+import pytest
+
 from seqnado.cli import (
     _assay_names,
     _coerce_value_to_dtype,
@@ -19,6 +22,14 @@ from seqnado.cli import (
     _style_name_with_rich,
     _write_json,
 )
+from seqnado.cli.autocomplete import fastq_autocomplete
+from seqnado.cli.commands.init import _init_sh_stamp, _matches_template
+from seqnado.cli.utils import (
+    _cached_assay_configs,
+    _read_packaged_bytes,
+    _write_bytes,
+    _write_csv,
+)
 
 
 def test_read_json(tmp_path):
@@ -48,6 +59,18 @@ def test_write_json(tmp_path):
     assert loaded == test_data
 
 
+def test_write_csv(tmp_path):
+    """Test writing a DataFrame to CSV without the index and with LF endings."""
+    import pandas as pd
+
+    df = pd.DataFrame({"sample_id": ["a", "b"], "r1": ["a_R1.fastq.gz", "b_R1.fastq.gz"]})
+    out = tmp_path / "design.csv"
+
+    _write_csv(df, out)
+
+    assert out.read_bytes() == b"sample_id,r1\na,a_R1.fastq.gz\nb,b_R1.fastq.gz\n"
+
+
 def test_snakemake_available():
     """Test checking if snakemake is available."""
     # Snakemake should be available in the test environment
@@ -73,6 +96,40 @@ def test_find_fastqs_with_directory(tmp_path):
     assert all("fastq" in p.name for p in result)
 
 
+def test_fastq_autocomplete_matches_prefix(tmp_path):
+    """Test FASTQ suggestions for a partially typed path."""
+    (tmp_path / "sample1_R1.fastq.gz").touch()
+    (tmp_path / "sample2_R1.fastq.gz").touch()
+    (tmp_path / "other_R1.fastq.gz").touch()
+    (tmp_path / "sample3.txt").touch()
+    (tmp_path / "sample_dir.fastq.gz").mkdir()
+
+    assert fastq_autocomplete(str(tmp_path / "sample")) == [
+        str(tmp_path / "sample1_R1.fastq.gz"),
+        str(tmp_path / "sample2_R1.fastq.gz"),
+    ]
+    assert len(fastq_autocomplete(str(tmp_path) + "/")) == 3
+    assert fastq_autocomplete(str(tmp_path / "missing" / "s")) == []
+
+    # Cached listings are refreshed once the directory changes
+    (tmp_path / "sample4_R1.fastq.gz").touch()
+    os.utime(tmp_path, ns=(0, tmp_path.stat().st_mtime_ns + 1))
+    assert len(fastq_autocomplete(str(tmp_path / "sample"))) == 3
+
+
+def test_fastq_autocomplete_hides_dotfiles_without_prefix(tmp_path):
+    """Test that hidden FASTQs are only suggested when the prefix asks for them."""
+    (tmp_path / "sample_R1.fastq.gz").touch()
+    (tmp_path / ".hidden_R1.fastq.gz").touch()
+
+    assert fastq_autocomplete(str(tmp_path) + "/") == [
+        str(tmp_path / "sample_R1.fastq.gz"),
+    ]
+    assert fastq_autocomplete(str(tmp_path / ".hid")) == [
+        str(tmp_path / ".hidden_R1.fastq.gz"),
+    ]
+
+
 def test_find_fastqs_with_glob(tmp_path):
     """Test finding FASTQ files with direct path (not glob pattern)."""
     (tmp_path / "sample1_R1.fastq.gz").touch()
@@ -344,6 +401,64 @@ def test_write_json_creates_parent_dir(tmp_path):
     assert loaded == data
 
 
+def test_write_bytes_copies_packaged_template_verbatim(tmp_path):
+    """Test that a template written with _write_bytes is byte-identical."""
+    template = _read_packaged_bytes("seqnado.data", "genomes_template.json")
+    out = tmp_path / "genome_config.json"
+
+    _write_bytes(out, template)
+
+    assert out.read_bytes() == template
+    assert _read_json(out) == json.loads(template)
+
+
+def test_matches_template_accepts_reserialized_template():
+    """Test that a template re-written with json.dumps still counts as untouched."""
+    template = _read_packaged_bytes("seqnado.data", "genomes_template.json")
+    legacy = json.dumps(json.loads(template), indent=4).encode("utf-8")
+
+    assert legacy != template
+    assert _matches_template(template, template)
+    assert _matches_template(legacy, template)
+    assert not _matches_template(b'{"custom": {}}', template)
+    with pytest.raises(ValueError):
+        _matches_template(b"not json", template)
+
+
+def test_init_sh_stamp_tracks_script_inputs(monkeypatch, tmp_path):
+    """Test that the init.sh stamp changes with the host and bind path."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("APPTAINER_BINDPATH", "/data:/data")
+    monkeypatch.setattr("socket.gethostname", lambda: "laptop")
+    base = _init_sh_stamp(b"echo init")
+
+    assert _init_sh_stamp(b"echo init") == base
+    assert _init_sh_stamp(b"echo changed") != base
+
+    monkeypatch.setenv("APPTAINER_BINDPATH", "/ceph:/ceph")
+    assert _init_sh_stamp(b"echo init") != base
+
+    monkeypatch.setenv("APPTAINER_BINDPATH", "/data:/data")
+    monkeypatch.setattr("socket.gethostname", lambda: "imm-login1")
+    assert _init_sh_stamp(b"echo init") != base
+
+
+def test_cached_assay_configs_rescans_after_change(tmp_path):
+    """Test that assay config discovery picks up a newly added config."""
+    (tmp_path / "config_rna.yaml").touch()
+    first = _cached_assay_configs(tmp_path)
+    assert [p.name for p in first.values()] == ["config_rna.yaml"]
+
+    (tmp_path / "config_atac.yaml").touch()
+    # Force a distinct mtime in case both writes land in the same tick
+    os.utime(tmp_path, ns=(0, tmp_path.stat().st_mtime_ns + 1))
+    second = _cached_assay_configs(tmp_path)
+    assert sorted(p.name for p in second.values()) == [
+        "config_atac.yaml",
+        "config_rna.yaml",
+    ]
+
+
 def test_find_fastqs_multiple_hints(tmp_path):
     """Test finding FASTQs from multiple directory hints."""
     dir1 = tmp_path / "dir1"
@@ -356,10 +471,23 @@ def test_find_fastqs_multiple_hints(tmp_path):
     (dir2 / "sample2_R1.fastq.gz").touch()
     
     result = _find_fastqs([str(dir1), str(dir2)])
-    
+
     assert len(result) == 3
 
 
+def test_find_fastqs_dedups_symlinks_and_orders_by_depth(tmp_path):
+    """Test that symlinked FASTQs are listed once, top-level files first."""
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (tmp_path / "b_R1.fastq.gz").touch()
+    (sub / "a_R1.fastq.gz").touch()
+    (sub / "link_R1.fastq.gz").symlink_to(tmp_path / "b_R1.fastq.gz")
+
+    result = _find_fastqs([str(tmp_path), str(sub)])
+
+    assert result == [tmp_path / "b_R1.fastq.gz", sub / "a_R1.fastq.gz"]
+
+
 def test_coerce_value_empty_string():
     """Test empty string handling."""
     result = _coerce_value_to_dtype("", str, categories=None)
@@ -18,6 +18,7 @@ import os
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / ".github" / "scripts"))
 
 from generate_environments import (
+    load_pyproject_info,
     parse_pyproject,
     separate_conda_and_pip,
     normalize_dep,
@@ -76,6 +77,19 @@ class TestParseProject:
         assert any("numpy" in d for d in dep_strs), "Should have numpy"
         assert any("pandas" in d for d in dep_strs), "Should have pandas"
 
+    def test_load_pyproject_info_is_cached(self):
+        """Should parse once and split deps consistently with the helpers."""
+        info = load_pyproject_info()
+        core_deps, slurm_deps, py_req = parse_pyproject()
+
+        assert load_pyproject_info() is info
+        assert info.py_req == py_req
+        assert info.core_deps == tuple(core_deps)
+        assert info.slurm_deps == tuple(slurm_deps)
+        assert (list(info.conda_deps), list(info.pip_deps)) == separate_conda_and_pip(
+            core_deps
+        )
+
 
 class TestDependencySeparation:
     """Test separating conda vs pip dependencies."""
@@ -116,7 +130,7 @@ class TestGenerateEnvironmentYml:
                 "snakemake>=9.12.0,<=9.14.5",
             ]
             
-            generate_environment_yml(core_deps, ">=3.10", tmpdir / "environment.yml")
+            generate_environment_yml(*separate_conda_and_pip(core_deps), ">=3.10", tmpdir / "environment.yml")
             
             # Should be valid YAML
             with open(tmpdir / "environment.yml") as f:
@@ -131,7 +145,7 @@ class TestGenerateEnvironmentYml:
         with tempfile.TemporaryDirectory() as tmpdir:
             tmpdir = Path(tmpdir)
             
-            generate_environment_yml([], ">=3.10", tmpdir / "environment.yml")
+            generate_environment_yml([], [], ">=3.10", tmpdir / "environment.yml")
             
             with open(tmpdir / "environment.yml") as f:
                 content = f.read()
@@ -145,7 +159,7 @@ class TestGenerateEnvironmentYml:
         with tempfile.TemporaryDirectory() as tmpdir:
             tmpdir = Path(tmpdir)
             
-            generate_environment_yml([], ">=3.10", tmpdir / "environment.yml")
+            generate_environment_yml([], [], ">=3.10", tmpdir / "environment.yml")
             
             with open(tmpdir / "environment.yml") as f:
                 first_line = f.readline()
@@ -169,7 +183,7 @@ class TestGenerateEnvironmentMinimalYml:
                 "pyyaml<=6.0.3",
             ]
             
-            generate_environment_minimal_yml(core_deps, ">=3.10", tmpdir / "environment_minimal.yml")
+            generate_environment_minimal_yml(*separate_conda_and_pip(core_deps), ">=3.10", tmpdir / "environment_minimal.yml")
             
             with open(tmpdir / "environment_minimal.yml") as f:
                 content = yaml.safe_load(f)
@@ -193,8 +207,8 @@ class TestGenerateEnvironmentMinimalYml:
                 "pyyaml<=6.0.3",
             ]
             
-            generate_environment_yml(core_deps, ">=3.10", tmpdir / "env_full.yml")
-            generate_environment_minimal_yml(core_deps, ">=3.10", tmpdir / "env_minimal.yml")
+            generate_environment_yml(*separate_conda_and_pip(core_deps), ">=3.10", tmpdir / "env_full.yml")
+            generate_environment_minimal_yml(*separate_conda_and_pip(core_deps), ">=3.10", tmpdir / "env_minimal.yml")
             
             with open(tmpdir / "env_full.yml") as f:
                 full = yaml.safe_load(f)
@@ -213,7 +227,7 @@ class TestGenerateTestingYml:
         with tempfile.TemporaryDirectory() as tmpdir:
             tmpdir = Path(tmpdir)
             
-            generate_testing_yml([], ">=3.10", tmpdir / "testing.yml")
+            generate_testing_yml([], [], ">=3.10", tmpdir / "testing.yml")
             
             with open(tmpdir / "testing.yml") as f:
                 content = yaml.safe_load(f)
@@ -222,6 +236,7 @@ class TestGenerateTestingYml:
             assert "pytest" in deps_str
             assert "pytest-cov" in deps_str
             assert "pytest-xdist" in deps_str
+            assert "tomli" in deps_str
     
     def test_includes_core_deps(self):
         """Should include core dependencies."""
@@ -233,7 +248,7 @@ class TestGenerateTestingYml:
                 "snakemake>=9.12.0,<=9.14.5",
             ]
             
-            generate_testing_yml(core_deps, ">=3.10", tmpdir / "testing.yml")
+            generate_testing_yml(*separate_conda_and_pip(core_deps), ">=3.10", tmpdir / "testing.yml")
             
             with open(tmpdir / "testing.yml") as f:
                 content = yaml.safe_load(f)
@@ -261,6 +276,24 @@ class TestNormalizeDep:
         assert name == "pytest"
         assert spec == "pytest"
 
+    def test_normalize_compatible_release(self):
+        """Should split on operators outside the common set, e.g. ~=."""
+        name, spec = normalize_dep("pkg~=1.0")
+
+        assert name == "pkg"
+        assert spec == "pkg~=1.0"
+
+    @pytest.mark.parametrize(
+        "dep",
+        ["snakemake-executor-plugin-slurm[extra]<=2.0.3", "tomli; python_version < '3.11'"],
+    )
+    def test_normalize_stops_at_first_non_name_character(self, dep):
+        """Extras and environment markers should not leak into the name."""
+        name, spec = normalize_dep(dep)
+
+        assert name == dep.split("[")[0].split(";")[0]
+        assert spec == dep
+
 
 class TestGenerateEnvironmentsIntegration:
     """Integration tests for environment generation."""
@@ -273,9 +306,9 @@ class TestGenerateEnvironmentsIntegration:
             core_deps, _, py_req = parse_pyproject()
             
             # Generate all files
-            generate_environment_yml(core_deps, py_req, tmpdir / "environment.yml")
-            generate_environment_minimal_yml(core_deps, py_req, tmpdir / "environment_minimal.yml")
-            generate_testing_yml(core_deps, py_req, tmpdir / "testing.yml")
+            generate_environment_yml(*separate_conda_and_pip(core_deps), py_req, tmpdir / "environment.yml")
+            generate_environment_minimal_yml(*separate_conda_and_pip(core_deps), py_req, tmpdir / "environment_minimal.yml")
+            generate_testing_yml(*separate_conda_and_pip(core_deps), py_req, tmpdir / "testing.yml")
             
             # All should be valid YAML
             for yml_file in [
@@ -299,9 +332,9 @@ class TestGenerateEnvironmentsIntegration:
             _, _, py_req = parse_pyproject()
             core_deps = ["numpy>=1.24,<=2.1.0"]
             
-            generate_environment_yml(core_deps, py_req, tmpdir / "environment.yml")
-            generate_environment_minimal_yml(core_deps, py_req, tmpdir / "environment_minimal.yml")
-            generate_testing_yml(core_deps, py_req, tmpdir / "testing.yml")
+            generate_environment_yml(*separate_conda_and_pip(core_deps), py_req, tmpdir / "environment.yml")
+            generate_environment_minimal_yml(*separate_conda_and_pip(core_deps), py_req, tmpdir / "environment_minimal.yml")
+            generate_testing_yml(*separate_conda_and_pip(core_deps), py_req, tmpdir / "testing.yml")
             
             for yml_file in [
                 tmpdir / "environment.yml",
@@ -410,6 +443,15 @@ class TestJinja2ExpressionHandling:
         
         assert restored == original
 
+    def test_roundtrip_many_expressions(self):
+        """Should not confuse __JINJA_1__ with __JINJA_10__ and beyond."""
+        original = "\n".join(f"key{i}: {{{{ value{i} }}}}" for i in range(12))
+
+        modified, placeholders = replace_jinja_expressions(original)
+        restored = restore_jinja_expressions(modified, placeholders)
+
+        assert restored == original
+
 
 class TestUpdateMetaYaml:
     """Test the full meta.yaml update function."""
@@ -109,3 +109,46 @@ def test_run_tool_help_in_container_filters_info(monkeypatch, sample_tools):
     help_text = tools.run_tool_help_in_container("alpha")
     assert "INFO:" not in help_text
     assert "Usage: alpha" in help_text
+
+
+def test_run_tool_meta_in_container_splits_version_and_help(monkeypatch, sample_tools):
+    calls = []
+
+    def fake_exec_in_container(tool_info, argv, container_uri=None):
+        calls.append(argv)
+        return 0, f"INFO: cached\nBeta 2.0\n{tools._META_SEPARATOR}\nUsage: beta", ""
+
+    monkeypatch.setattr(tools, "_exec_in_container", fake_exec_in_container)
+    meta = tools.run_tool_meta_in_container("beta")
+    assert len(calls) == 1
+    assert calls[0][:2] == ["sh", "-c"]
+    assert meta["version"] == "2.0"
+    assert meta["help"] == "Usage: beta"
+
+
+def test_iter_tool_help_in_container_yields_filtered_lines(monkeypatch, sample_tools):
+    def fake_container_command(tool_info, argv, container_uri=None):
+        return ["printf", "INFO: cached\\nUsage: alpha\\n  -h  help\\n"], ""
+
+    monkeypatch.setattr(tools, "_container_command", fake_container_command)
+    lines = list(tools.iter_tool_help_in_container("alpha"))
+    assert lines == ["Usage: alpha", "  -h  help"]
+
+
+def test_iter_tool_help_in_container_falls_back_on_container_error(
+    monkeypatch, sample_tools
+):
+    def fake_container_command(tool_info, argv, container_uri=None):
+        return ["sh", "-c", "echo 'FATAL: failed to pull image' >&2; exit 255"], ""
+
+    monkeypatch.setattr(tools, "_container_command", fake_container_command)
+    monkeypatch.setattr(
+        tools, "run_tool_help_in_container", lambda *args, **kwargs: "fallback"
+    )
+    assert list(tools.iter_tool_help_in_container("alpha")) == ["fallback"]
+
+
+def test_list_tools_filters_by_category(sample_tools):
+    assert [t[0] for t in tools.list_tools("quality control")] == ["beta"]
+    assert [t[0] for t in tools.list_tools()] == ["alpha", "beta", "gamma"]
+    assert tools.list_tools("missing") == []
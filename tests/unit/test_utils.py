@@ -8,6 +8,7 @@ import pytest
 from seqnado.utils import (
     extract_apptainer_args,
     extract_cores_from_options,
+    get_preset_profiles,
     pepe_silvia,
     remove_unwanted_run_files,
     run_batch_job_on_error,
@@ -64,6 +65,21 @@ class TestExtractCoresFromOptions:
         assert result_options == ["--other", "value"]
 
 
+class TestGetPresetProfiles:
+    """Tests for get_preset_profiles function."""
+
+    def test_returns_fresh_dict_each_call(self):
+        """Mutating the result must not leak into the cached scan."""
+        first = get_preset_profiles()
+        first["zz"] = "profile_bogus"
+        assert "zz" not in get_preset_profiles()
+
+    def test_maps_shortcodes_to_profile_dirs(self):
+        """Every mapped directory name is a profile_* directory."""
+        profiles = get_preset_profiles()
+        assert all(name.startswith("profile_") for name in profiles.values())
+
+
 class TestExtractApptainerArgs:
     """Tests for extract_apptainer_args function."""
 